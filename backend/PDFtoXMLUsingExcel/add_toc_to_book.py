@@ -13,10 +13,11 @@ DTD Structure for TOC:
 This is safer and more structured than using itemizedlist inside a chapter.
 """
 
+import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 def extract_chapter_entities(book_xml_content: str) -> List[Tuple[str, str]]:
@@ -45,26 +46,36 @@ def extract_chapter_entities(book_xml_content: str) -> List[Tuple[str, str]]:
     return chapters
 
 
-def read_chapter_title(chapter_path: Path) -> str:
+def extract_chapter_title(content: str) -> str:
     """
-    Extract title from a chapter XML file.
+    Extract the title from chapter XML content.
 
     Returns:
         Chapter title text, or empty string if not found
     """
-    try:
-        content = chapter_path.read_text(encoding='utf-8')
+    # Find <title> element (first one after <chapter>)
+    title_match = re.search(r'<chapter[^>]*>.*?<title[^>]*>(.*?)</title>', content, re.DOTALL)
+    if title_match:
+        title_text = title_match.group(1)
+
+        # Clean up: remove any XML tags within title
+        title_text = re.sub(r'<[^>]+>', '', title_text)
+        title_text = title_text.strip()
 
-        # Find <title> element (first one after <chapter>)
-        title_match = re.search(r'<chapter[^>]*>.*?<title[^>]*>(.*?)</title>', content, re.DOTALL)
-        if title_match:
-            title_text = title_match.group(1)
+        return title_text
 
-            # Clean up: remove any XML tags within title
-            title_text = re.sub(r'<[^>]+>', '', title_text)
-            title_text = title_text.strip()
+    return ""
+
+
+def read_chapter_title(chapter_path: Path) -> str:
+    """
+    Extract title from a chapter XML file.
 
-            return title_text
+    Returns:
+        Chapter title text, or empty string if not found
+    """
+    try:
+        return extract_chapter_title(chapter_path.read_text(encoding='utf-8'))
 
     except Exception as e:
         print(f"Warning: Could not read title from {chapter_path}: {e}")
@@ -103,41 +114,34 @@ def generate_toc_element(chapters: List[Tuple[str, str, str]]) -> str:
     return '\n'.join(toc_lines)
 
 
-def add_toc_to_book_xml(
-    book_xml_path: Path,
-    chapter_dir: Path,
-    output_path: Path = None
-) -> bool:
+def add_toc_to_book_content(
+    content: str,
+    chapter_contents: Dict[str, str]
+) -> Optional[str]:
     """
-    Add TOC element to Book.XML in a DTD-compliant way.
+    Add TOC element to Book.XML content held in memory.
 
     Args:
-        book_xml_path: Path to Book.XML file
-        chapter_dir: Directory containing chapter XML files
-        output_path: Optional output path (default: overwrite input)
+        content: Book.XML text
+        chapter_contents: Mapping of chapter filename to its XML text
+                          (used to extract chapter titles)
 
     Returns:
-        True if successful, False otherwise
+        Updated Book.XML text, or None if no entities/insertion point found
     """
-    if output_path is None:
-        output_path = book_xml_path
-
-    # Read Book.XML
-    content = book_xml_path.read_text(encoding='utf-8')
-
     # Extract chapter entities
     chapter_entities = extract_chapter_entities(content)
     if not chapter_entities:
         print("Error: No chapter entities found in Book.XML")
-        return False
+        return None
 
     print(f"Found {len(chapter_entities)} chapter references")
 
     # Read chapter titles
     chapters_with_titles = []
     for entity_name, filename in chapter_entities:
-        chapter_path = chapter_dir / filename
-        title = read_chapter_title(chapter_path) if chapter_path.exists() else ""
+        chapter_content = chapter_contents.get(filename)
+        title = extract_chapter_title(chapter_content) if chapter_content else ""
         chapters_with_titles.append((entity_name, filename, title))
         if title:
             print(f"  {filename}: {title}")
@@ -155,15 +159,57 @@ def add_toc_to_book_xml(
     if not match:
         print("Error: Could not find insertion point for TOC")
         print("Looking for pattern: </bookinfo> ... &ch0001;")
-        return False
+        return None
 
     # Insert TOC
     new_content = content[:match.end(1)] + '\n' + toc_xml + '\n' + content[match.start(2):]
+    print(f"  Added {len(chapters_with_titles)} chapter entries")
+
+    return new_content
+
+
+def add_toc_to_book_xml(
+    book_xml_path: Path,
+    chapter_dir: Path,
+    output_path: Path = None
+) -> bool:
+    """
+    Add TOC element to Book.XML in a DTD-compliant way.
+
+    Args:
+        book_xml_path: Path to Book.XML file
+        chapter_dir: Directory containing chapter XML files
+        output_path: Optional output path (default: overwrite input)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if output_path is None:
+        output_path = book_xml_path
+
+    # Read Book.XML
+    content = book_xml_path.read_text(encoding='utf-8')
+
+    # Gather chapter contents for title extraction. One directory scan
+    # gives us every filename, instead of a stat() call per entity
+    present_files = {entry.name for entry in os.scandir(chapter_dir)}
+    chapter_contents = {}
+    for entity_name, filename in extract_chapter_entities(content):
+        if filename not in present_files:
+            continue
+        chapter_path = chapter_dir / filename
+        try:
+            chapter_contents[filename] = chapter_path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Warning: Could not read title from {chapter_path}: {e}")
+
+    new_content = add_toc_to_book_content(content, chapter_contents)
+    if new_content is None:
+        return False
 
     # Write output
     output_path.write_text(new_content, encoding='utf-8')
     print(f"\n✓ TOC added successfully to {output_path}")
-    print(f"  Added {len(chapters_with_titles)} chapter entries")
 
     return True
 
@@ -11,74 +11,108 @@ Can be integrated into pdf_to_excel_columns.py or used as a standalone fix.
 """
 
 import statistics
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
+# Memoization cache for is_single_column_page. The detection is pure and
+# fragment lists are rebuilt per page, so a cheap fingerprint of the page
+# geometry (plus a sampled col_id prefix, since criterion 3 reads col_ids)
+# lets repeated calls — e.g. pre- and post-smoothing — skip the O(n) scan.
+_SINGLE_COLUMN_CACHE: Dict[tuple, bool] = {}
+_SINGLE_COLUMN_CACHE_MAX = 256
+
+
+def _cache_clear() -> None:
+    """Clear the is_single_column_page memoization cache (for tests)."""
+    _SINGLE_COLUMN_CACHE.clear()
 
 
 def is_single_column_page(fragments: List[Dict[str, Any]], col_starts: List[float], page_width: float) -> bool:
     """
     Detect if a page is truly single-column.
-    
+
     A page is considered single-column if:
     1. Only one column start was detected, OR
     2. >80% of fragments are left-aligned to the same position (±20px), OR
     3. The page has very few column-2+ fragments
-    
+
+    Results are memoized on a fingerprint of the page, so calling this
+    repeatedly on the same fragment list is cheap.
+
     Args:
         fragments: List of text fragments
         col_starts: Detected column start positions
         page_width: Width of the page
-    
+
     Returns:
         True if page is single-column
     """
     if not fragments:
         return True
-    
+
+    key = (
+        len(fragments),
+        tuple(col_starts),
+        round(page_width, 1),
+        hash(tuple(
+            (round(f["left"], 1), round(f["width"], 1), f.get("col_id"))
+            for f in fragments[:32]
+        )),
+    )
+    cached = _SINGLE_COLUMN_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = _is_single_column_page_uncached(fragments, col_starts, page_width)
+
+    if len(_SINGLE_COLUMN_CACHE) >= _SINGLE_COLUMN_CACHE_MAX:
+        # FIFO eviction: drop the oldest entry
+        _SINGLE_COLUMN_CACHE.pop(next(iter(_SINGLE_COLUMN_CACHE)))
+    _SINGLE_COLUMN_CACHE[key] = result
+    return result
+
+
+def _is_single_column_page_uncached(fragments: List[Dict[str, Any]], col_starts: List[float], page_width: float) -> bool:
+    """Uncached single-column detection (see is_single_column_page)."""
     # Criterion 1: Only one column detected
     if len(col_starts) <= 1:
         return True
-    
+
     # Criterion 2: Check if >80% of fragments start at similar left position
-    # This catches single-column pages with some indented content
-    left_positions = [f["left"] for f in fragments]
-    
-    # Find the most common left position (mode)
-    # Use a tolerance of 20 pixels to group similar positions
-    left_groups = {}
-    for left in left_positions:
-        # Find if this left position matches an existing group
-        matched = False
-        for group_left in left_groups:
-            if abs(left - group_left) < 20:
-                left_groups[group_left] += 1
-                matched = True
-                break
-        if not matched:
-            left_groups[left] = 1
-    
-    if left_groups:
-        max_group_count = max(left_groups.values())
-        left_alignment_ratio = max_group_count / len(fragments)
-        
-        if left_alignment_ratio > 0.80:
-            return True
+    # This catches single-column pages with some indented content.
+    # Histogram the left coordinates into 1px bins with np.bincount, then a
+    # box filter sums every ±20px window at once — the densest window is
+    # the best left-alignment group, replacing the greedy Python grouping
+    lefts = np.fromiter((f["left"] for f in fragments), dtype=np.float64, count=len(fragments))
+    bins = np.clip(np.rint(lefts), 0, None).astype(np.int64)
+    histogram = np.bincount(bins, minlength=int(page_width) + 1)
+    window_counts = np.convolve(histogram, np.ones(41, dtype=np.int64), mode='same')
+
+    left_alignment_ratio = window_counts.max() / len(fragments)
+    if left_alignment_ratio > 0.80:
+        return True
     
     # Criterion 3: Check if page has actual multi-column content
     # If all fragments have ColId 0 or 1, and there's weaving, it's likely single-column
     if all(f.get("col_id") in (0, 1, None) for f in fragments):
-        # Count transitions between 0 and 1
-        col_ids = [f.get("col_id") for f in sorted(fragments, key=lambda x: x.get("baseline", 0))]
-        col_ids = [c for c in col_ids if c is not None]
-        
-        if col_ids:
-            transitions = sum(1 for i in range(1, len(col_ids)) 
-                            if col_ids[i] != col_ids[i-1] and 
-                            {col_ids[i], col_ids[i-1]} == {0, 1})
-            
-            # If there are many transitions (>5), likely a single-column page with weaving issue
-            if transitions > 5:
-                return True
-    
+        # Count transitions between 0 and 1 with an early exit: return as
+        # soon as the weaving threshold (>5) is crossed instead of
+        # scanning the remaining fragments. Only 0 and 1 survive the
+        # all() check above, so any change of value is a 0<->1 transition
+        transitions = 0
+        prev = None
+        for f in sorted(fragments, key=lambda x: x.get("baseline", 0)):
+            col_id = f.get("col_id")
+            if col_id is None:
+                continue
+            if prev is not None and col_id != prev:
+                transitions += 1
+                # Many transitions: likely a single-column page with weaving issue
+                if transitions > 5:
+                    return True
+            prev = col_id
+
     return False
 
 
@@ -102,57 +136,213 @@ def smooth_colid_transitions(fragments: List[Dict[str, Any]], min_group_size: in
     
     # Sort by reading order (or baseline if reading order not set)
     fragments.sort(key=lambda f: (f.get("reading_order_index", 0), f.get("baseline", 0)))
-    
-    # Find isolated groups
-    i = 0
-    while i < len(fragments):
-        current_col_id = fragments[i]["col_id"]
-        group_start = i
-        
-        # Find end of current ColId group
-        while i < len(fragments) and fragments[i]["col_id"] == current_col_id:
-            i += 1
-        
-        group_size = i - group_start
-        
+
+    n = len(fragments)
+
+    # Run-length encode the ColId sequence: run boundaries fall out of one
+    # np.diff over a contiguous array instead of a branchy per-fragment
+    # scan (None maps to -1 for comparison only; dict values keep None)
+    ids = np.fromiter(
+        (f["col_id"] if f["col_id"] is not None else -1 for f in fragments),
+        dtype=np.int32, count=n
+    )
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ids) != 0) + 1))
+    ends = np.concatenate((starts[1:], [n]))
+
+    widths = None
+    page_width = None
+
+    for start, end in zip(starts, ends):
+        group_size = end - start
+
         # If group is small and surrounded by different ColId, consider reassigning
-        if group_size < min_group_size and group_start > 0 and i < len(fragments):
-            prev_col_id = fragments[group_start - 1]["col_id"]
-            next_col_id = fragments[i]["col_id"] if i < len(fragments) else None
-            
-            # Only reassign if isolated between same ColId
-            if prev_col_id == next_col_id and prev_col_id != current_col_id:
-                # Special case: Don't merge ColId 0 into ColId 1+ if the group spans full width
-                # This prevents losing genuinely full-width content
-                if current_col_id == 0:
-                    # Check if any fragment in the group is truly full-width
-                    page_width = max(f["left"] + f["width"] for f in fragments)
-                    has_full_width = any(
-                        f["width"] >= page_width * 0.60
-                        for f in fragments[group_start:i]
-                    )
-                    if has_full_width:
-                        continue  # Don't reassign full-width content
-                
-                # Reassign isolated group to match neighbors
-                for j in range(group_start, i):
-                    fragments[j]["col_id"] = prev_col_id
+        if group_size >= min_group_size or start == 0 or end == n:
+            continue
+
+        prev_col_id = ids[start - 1]  # reflects any earlier merge
+        next_col_id = ids[end]
+        current_col_id = ids[start]
+
+        # Only reassign if isolated between same ColId
+        if prev_col_id != next_col_id or prev_col_id == current_col_id:
+            continue
+
+        # Special case: Don't merge ColId 0 into ColId 1+ if the group spans full width
+        # This prevents losing genuinely full-width content
+        if current_col_id == 0:
+            if widths is None:
+                widths = np.fromiter((f["width"] for f in fragments), dtype=np.float64, count=n)
+                lefts = np.fromiter((f["left"] for f in fragments), dtype=np.float64, count=n)
+                page_width = float((lefts + widths).max())
+            # Check if any fragment in the group is truly full-width
+            if (widths[start:end] >= page_width * 0.60).any():
+                continue  # Don't reassign full-width content
+
+        # Reassign isolated group to match neighbors
+        ids[start:end] = prev_col_id
+        new_col_id = fragments[start - 1]["col_id"]
+        for j in range(start, end):
+            fragments[j]["col_id"] = new_col_id
+
+
+class _FragmentProxy:
+    """Dict-like view of one fragment inside a FragmentView."""
+
+    __slots__ = ("_view", "_index")
+
+    def __init__(self, view: "FragmentView", index: int):
+        self._view = view
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "col_id":
+            cid = int(self._view.col_id[self._index])
+            return None if cid == FragmentView.COL_ID_NONE else cid
+        if key == "text":
+            return self._view.text[self._index]
+        return float(getattr(self._view, key)[self._index])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "col_id":
+            self._view.col_id[self._index] = (
+                FragmentView.COL_ID_NONE if value is None else value
+            )
+        elif key == "text":
+            self._view.text[self._index] = value
+        else:
+            getattr(self._view, key)[self._index] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except AttributeError:
+            return default
+
+
+class FragmentView:
+    """
+    Structure-of-arrays fragment container.
+
+    Stores the numeric fragment fields as parallel NumPy arrays so hot
+    paths (transition counting, ColId assignment) run on contiguous
+    buffers, while indexing still yields a dict-like proxy for code that
+    reads or writes one fragment at a time. col_id is an int32 array with
+    COL_ID_NONE standing in for None.
+    """
+
+    COL_ID_NONE = -1
+    _NUMERIC_FIELDS = ("top", "left", "width", "height", "baseline", "reading_order_index")
+
+    __slots__ = _NUMERIC_FIELDS + ("col_id", "text")
+
+    def __init__(self, n: int):
+        for field in self._NUMERIC_FIELDS:
+            setattr(self, field, np.zeros(n, dtype=np.float64))
+        self.col_id = np.full(n, self.COL_ID_NONE, dtype=np.int32)
+        self.text = [""] * n
+
+    @classmethod
+    def from_dicts(cls, fragments: List[Dict[str, Any]]) -> "FragmentView":
+        """Build a view from a list of fragment dicts."""
+        view = cls(len(fragments))
+        for i, f in enumerate(fragments):
+            for field in cls._NUMERIC_FIELDS:
+                getattr(view, field)[i] = f.get(field, 0)
+            cid = f.get("col_id")
+            view.col_id[i] = cls.COL_ID_NONE if cid is None else cid
+            view.text[i] = f.get("text", "")
+        return view
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize plain fragment dicts (for code that needs them)."""
+        return [
+            {
+                **{field: float(getattr(self, field)[i]) for field in self._NUMERIC_FIELDS},
+                "col_id": None if self.col_id[i] == self.COL_ID_NONE else int(self.col_id[i]),
+                "text": self.text[i],
+            }
+            for i in range(len(self))
+        ]
+
+    def __len__(self) -> int:
+        return self.col_id.size
+
+    def __getitem__(self, index: int) -> _FragmentProxy:
+        return _FragmentProxy(self, index)
+
+    def __iter__(self):
+        return (_FragmentProxy(self, i) for i in range(len(self)))
 
 
 def assign_single_column_ids(fragments: List[Dict[str, Any]], use_col_id: int = 1) -> None:
     """
     Assign a consistent ColId to all fragments on a single-column page.
-    
+
     Args:
-        fragments: List of text fragments (modified in-place)
+        fragments: List of text fragments or a FragmentView (modified in-place)
         use_col_id: ColId to assign (default: 1)
                    Use 1 to treat as "Column 1"
                    Use 0 to treat as "Full-width content"
     """
+    if isinstance(fragments, FragmentView):
+        fragments.col_id[:] = use_col_id
+        return
     for f in fragments:
         f["col_id"] = use_col_id
 
 
+def assign_colids_pooled(fragments: List[Dict[str, Any]], page_width: float, col_starts: List[float]) -> bool:
+    """
+    Assign ColIds by equispaced column pooling in one vectorized pass.
+
+    The column band [P1, P2] is estimated from 1%-trimmed medians of the
+    left and right fragment extents and divided into len(col_starts)
+    equal pools; each fragment lands in pool (left - P1) // pool_width.
+    Full-width detection (page margins / 45% of page width) keeps the
+    same rules as the boundary-based assignment. Because the assignment
+    is monotonic in the left coordinate, no smoothing pass is needed on
+    regular multi-column layouts.
+
+    Args:
+        fragments: List of text fragments (modified in-place)
+        page_width: Width of the page
+        col_starts: Detected column start positions (one pool per start)
+
+    Returns:
+        True if pooling was applied, False if the column band degenerates
+        (caller should fall back to boundary-based assignment)
+    """
+    num_cols = len(col_starts)
+    n = len(fragments)
+    if n == 0 or num_cols < 2:
+        return False
+
+    lefts = np.fromiter((f["left"] for f in fragments), dtype=np.float64, count=n)
+    widths = np.fromiter((f["width"] for f in fragments), dtype=np.float64, count=n)
+    rights = lefts + widths
+
+    # 1%-trimmed extents: median of the smallest/largest percentile so a
+    # stray fragment cannot stretch the band
+    k = max(1, n // 100)
+    p1 = float(np.median(np.partition(lefts, k - 1)[:k]))
+    p2 = float(np.median(np.partition(rights, n - k)[n - k:]))
+    pool_width = (p2 - p1) / num_cols
+    if pool_width <= 0:
+        return False
+
+    margin = page_width * 0.05
+    full_width = (
+        ((lefts <= margin) & (rights >= page_width - margin))
+        | (widths >= page_width * 0.45)
+    )
+    pools = np.clip((lefts - p1) // pool_width, 0, num_cols - 1).astype(np.int32) + 1
+    col_ids = np.where(full_width, 0, pools)
+
+    for f, col_id in zip(fragments, col_ids):
+        f["col_id"] = int(col_id)
+    return True
+
+
 def improved_assign_column_ids(
     fragments: List[Dict[str, Any]],
     page_width: float,
@@ -183,43 +373,47 @@ def improved_assign_column_ids(
         assign_single_column_ids(fragments, use_col_id=single_column_colid)
         return
     
-    # === Original assign_column_ids logic ===
-    margin_ratio = 0.05
-    left_margin = page_width * margin_ratio
-    right_margin = page_width * (1.0 - margin_ratio)
-    
-    # Calculate column boundaries (midpoints between adjacent column starts)
-    boundaries = []
-    for i in range(len(col_starts) - 1):
-        midpoint = (col_starts[i] + col_starts[i + 1]) / 2.0
-        boundaries.append(midpoint)
-    
-    for f in fragments:
-        left = f["left"]
-        right = f["left"] + f["width"]
-        width = f["width"]
-        
-        # Full-width if it essentially spans from near-left to near-right
-        if left <= left_margin and right >= right_margin:
-            f["col_id"] = 0
-        elif width >= page_width * 0.45:
-            f["col_id"] = 0
-        else:
-            # Assign based on LEFT edge position relative to boundaries
-            if left < boundaries[0]:
-                f["col_id"] = 1
-            elif len(boundaries) > 1 and left >= boundaries[-1]:
-                f["col_id"] = len(col_starts)
+    # === Equispaced column pooling (vectorized fast path) ===
+    pooled = assign_colids_pooled(fragments, page_width, col_starts)
+
+    if not pooled:
+        # Degenerate column band: fall back to the original boundary logic
+        margin_ratio = 0.05
+        left_margin = page_width * margin_ratio
+        right_margin = page_width * (1.0 - margin_ratio)
+
+        # Calculate column boundaries (midpoints between adjacent column starts)
+        boundaries = []
+        for i in range(len(col_starts) - 1):
+            midpoint = (col_starts[i] + col_starts[i + 1]) / 2.0
+            boundaries.append(midpoint)
+
+        for f in fragments:
+            left = f["left"]
+            right = f["left"] + f["width"]
+            width = f["width"]
+
+            # Full-width if it essentially spans from near-left to near-right
+            if left <= left_margin and right >= right_margin:
+                f["col_id"] = 0
+            elif width >= page_width * 0.45:
+                f["col_id"] = 0
             else:
-                # Find which column territory the left edge falls into
-                for i in range(len(boundaries)):
-                    if i == len(boundaries) - 1:
-                        f["col_id"] = i + 2
-                        break
-                    elif left < boundaries[i + 1]:
-                        f["col_id"] = i + 1
-                        break
-    
+                # Assign based on LEFT edge position relative to boundaries
+                if left < boundaries[0]:
+                    f["col_id"] = 1
+                elif len(boundaries) > 1 and left >= boundaries[-1]:
+                    f["col_id"] = len(col_starts)
+                else:
+                    # Find which column territory the left edge falls into
+                    for i in range(len(boundaries)):
+                        if i == len(boundaries) - 1:
+                            f["col_id"] = i + 2
+                            break
+                        elif left < boundaries[i + 1]:
+                            f["col_id"] = i + 1
+                            break
+
     # === NEW: Single-column detection ===
     if enable_single_column_detection:
         if is_single_column_page(fragments, col_starts, page_width):
@@ -228,10 +422,112 @@ def improved_assign_column_ids(
             return
     
     # === NEW: Smoothing ===
-    if enable_smoothing:
+    # Pooled assignment is monotonic in the left coordinate, so smoothing
+    # is only needed after the boundary fallback
+    if enable_smoothing and not pooled:
         smooth_colid_transitions(fragments, min_group_size=3)
 
 
+# Low bit of 2-bit lanes 0..30 in a packed uint64 word (lane 31 holds the
+# garbage shifted in by the lane-vs-next-lane comparison and is masked off)
+_SWAR_LANES_LOW = np.uint64(0x1555555555555555)
+
+# np.bitwise_count needs NumPy >= 2.0; requirements.txt allows 1.x, where
+# the packed path must stay disabled in favor of the plain comparison
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+
+
+def _sorted_colid_sequence(fragments) -> Tuple[List[Any], Any]:
+    """Return (colid list in reading order, int8 array with None as -1)."""
+    if isinstance(fragments, FragmentView):
+        # Arrays are already contiguous; no per-fragment dict reads needed
+        order = np.lexsort((fragments.baseline, fragments.reading_order_index))
+        ids = fragments.col_id[order].astype(np.int8)
+        col_ids = [None if c == FragmentView.COL_ID_NONE else int(c) for c in ids]
+        return col_ids, ids
+
+    sorted_frags = sorted(fragments, key=lambda f: (
+        f.get("reading_order_index", 0),
+        f.get("baseline", 0)
+    ))
+    col_ids = [f["col_id"] for f in sorted_frags]
+    ids = np.fromiter(
+        (c if c is not None else -1 for c in col_ids),
+        dtype=np.int8, count=len(col_ids)
+    )
+    return col_ids, ids
+
+
+def _packed_transition_counts(ids) -> Tuple[int, int]:
+    """
+    Count (all, 0<->1) ColId transitions with SWAR bit packing.
+
+    Packs 2-bit ColId codes 32 per uint64 word, so one XOR + popcount
+    handles 31 adjacent-pair comparisons at a time. The caller must
+    guarantee every value is in 0..3.
+    """
+    n = ids.size
+    if n < 2:
+        return 0, 0
+
+    # Pad to a multiple of 32 with the last value (creates no transitions)
+    codes = ids.astype(np.uint64)
+    pad = (-n) % 32
+    if pad:
+        codes = np.concatenate((codes, np.full(pad, codes[-1], dtype=np.uint64)))
+    lanes = codes.reshape(-1, 32)
+    shifts = np.arange(32, dtype=np.uint64) * np.uint64(2)
+    packed = np.bitwise_or.reduce(lanes << shifts, axis=1)
+
+    # Lane k of x/z combines elements k and k+1 of each word (k = 0..30)
+    two, one = np.uint64(2), np.uint64(1)
+    x = packed ^ (packed >> two)
+    z = packed | (packed >> two)
+    diff = (x | (x >> one)) & _SWAR_LANES_LOW
+    # {a, b} == {0, 1} exactly when a^b == 01 and a|b == 01 in the lane
+    weave = x & ~(x >> one) & z & ~(z >> one) & _SWAR_LANES_LOW
+    transitions = int(np.bitwise_count(diff).sum())
+    weaving = int(np.bitwise_count(weave).sum())
+
+    # Word-boundary pairs: element 31 of word w vs element 0 of word w+1
+    last, first = lanes[:-1, 31], lanes[1:, 0]
+    transitions += int(np.count_nonzero(last != first))
+    weaving += int(np.count_nonzero(((last ^ first) == one) & ((last | first) == one)))
+    return transitions, weaving
+
+
+def analyze_colid_quality_fast(fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Bitpacked variant of analyze_colid_quality for large pages.
+
+    Produces the same metrics dict; transition counting runs on packed
+    uint64 words when every ColId fits in 2 bits and NumPy provides
+    bitwise_count, otherwise it falls back to the plain vectorized
+    comparison.
+    """
+    if not fragments:
+        return analyze_colid_quality(fragments)
+
+    col_ids, ids = _sorted_colid_sequence(fragments)
+
+    if _HAS_BITWISE_COUNT and ids.min() >= 0 and ids.max() <= 3:
+        transition_count, weaving_01_count = _packed_transition_counts(ids)
+    else:
+        prev, curr = ids[:-1], ids[1:]
+        transition_count = int(np.count_nonzero(prev != curr))
+        weaving_01_count = int(np.count_nonzero(
+            ((prev == 0) & (curr == 1)) | ((prev == 1) & (curr == 0))
+        ))
+
+    return {
+        "transition_count": transition_count,
+        "weaving_01_count": weaving_01_count,
+        "unique_colids": set(col_ids),
+        "has_weaving": weaving_01_count > 3,
+        "colid_sequence": col_ids,
+    }
+
+
 def analyze_colid_quality(fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Analyze the quality of ColId assignments on a page.
@@ -259,23 +555,24 @@ def analyze_colid_quality(fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
             "colid_sequence": [],
         }
     
-    # Sort by reading order
-    sorted_frags = sorted(fragments, key=lambda f: (
-        f.get("reading_order_index", 0),
-        f.get("baseline", 0)
-    ))
-    
-    col_ids = [f["col_id"] for f in sorted_frags]
+    # Large pages take the bitpacked path when ColIds fit in 2 bits
+    if len(fragments) > 512:
+        return analyze_colid_quality_fast(fragments)
+
+    # Sort by reading order; transitions are counted on a contiguous
+    # integer array instead of a Python loop over dicts (None maps to -1
+    # so it never pairs with 0 or 1)
+    col_ids, ids = _sorted_colid_sequence(fragments)
     unique_colids = set(col_ids)
-    
+    prev, curr = ids[:-1], ids[1:]
+
     # Count all transitions
-    transition_count = sum(1 for i in range(1, len(col_ids)) if col_ids[i] != col_ids[i-1])
-    
+    transition_count = int(np.count_nonzero(prev != curr))
+
     # Count weaving transitions (specifically between 0 and 1)
-    weaving_01_count = sum(
-        1 for i in range(1, len(col_ids))
-        if col_ids[i] != col_ids[i-1] and {col_ids[i], col_ids[i-1]} == {0, 1}
-    )
+    weaving_01_count = int(np.count_nonzero(
+        ((prev == 0) & (curr == 1)) | ((prev == 1) & (curr == 0))
+    ))
     
     # Weaving detected if >3 transitions between 0 and 1
     has_weaving = weaving_01_count > 3
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import string
 from dataclasses import dataclass, field
 from pathlib import Path
 from statistics import median
@@ -877,10 +878,63 @@ CAPTION_RE = re.compile(r"^(figure|fig\.|table)\s+\d+", re.IGNORECASE)
 # - Digits with period/paren: 1. 2) (3. etc.
 # - Letters with period/paren BUT exclude I/i (Roman numerals for sections)
 # - Requires at least 2 word chars after the marker to avoid abbreviations
-ORDERED_LIST_RE = re.compile(r"^(?:\(?\d{1,3}[\.\)]|[A-HJ-Za-hj-z][\.\)])\s+(?=\w{2,})")
+# ASCII-only: list markers in real documents are plain ASCII, and Unicode
+# digit classes (Arabic-Indic, fullwidth, ...) only produced false
+# positives. Non-ASCII digits are intentionally excluded.
+ORDERED_LIST_RE = re.compile(r"^(?:\(?\d{1,3}[\.\)]|[A-HJ-Za-hj-z][\.\)])\s+(?=\w{2,})", re.ASCII)
+
+_ASCII_WS = " \t\n\r\f\v"
+
+
+def _is_ascii_word_char(c: str) -> bool:
+    """ASCII \\w: [a-zA-Z0-9_]."""
+    return c == "_" or (c.isascii() and c.isalnum())
+
+
+def _match_ordered(s: str) -> int:
+    """
+    Hand-rolled equivalent of ORDERED_LIST_RE.match(s).
+
+    Returns the match end index (just past the marker's trailing
+    whitespace; the word-char lookahead is not consumed) or -1 on no
+    match. Avoids regex engine overhead on the per-line hot path; the
+    compiled pattern above stays as the authoritative spec.
+    """
+    n = len(s)
+    # Branch 1: optional '(' then 1-3 ASCII digits then '.' or ')'
+    j = 1 if s.startswith("(") else 0
+    k = j
+    while k < n and k - j < 3 and "0" <= s[k] <= "9":
+        k += 1
+    if k > j and k < n and (s[k] == "." or s[k] == ")"):
+        i = k + 1
+    else:
+        # Branch 2: a single letter, excluding I/i (Roman numeral sections)
+        c = s[0] if n else ""
+        if (("A" <= c <= "H") or ("J" <= c <= "Z")
+                or ("a" <= c <= "h") or ("j" <= c <= "z")) \
+                and n > 1 and (s[1] == "." or s[1] == ")"):
+            i = 2
+        else:
+            return -1
+    # At least one ASCII whitespace character after the marker
+    start_ws = i
+    while i < n and s[i] in _ASCII_WS:
+        i += 1
+    if i == start_ws:
+        return -1
+    # Lookahead: at least 2 word characters follow (avoids abbreviations)
+    if i + 1 < n and _is_ascii_word_char(s[i]) and _is_ascii_word_char(s[i + 1]):
+        return i
+    return -1
+
 
 HEADING_FONT_TOLERANCE = 1.0
 
+# Index alphabet headers are single A-Z letters; one frozenset membership
+# test replaces the len/isupper/isalpha predicate chain
+_ALPHABET_SET = frozenset(string.ascii_uppercase)
+
 
 def _get_bookmark_page_number(bookmark, reader) -> Optional[int]:
     """
@@ -1562,82 +1616,139 @@ def _looks_like_caption(line: Line) -> bool:
     return False
 
 
+# Marker lists come from long-lived config mappings, so one id()-keyed
+# cache lookup replaces the two nested dict .get() calls on every line
+_LIST_MARKERS_CACHE: dict = {}
+
+
+def _list_markers(mapping: dict) -> tuple:
+    """Return the configured list markers as a cached tuple."""
+    key = id(mapping)
+    markers = _LIST_MARKERS_CACHE.get(key)
+    if markers is None:
+        markers = tuple(mapping.get("pdf", {}).get("list_markers", []))
+        _LIST_MARKERS_CACHE[key] = markers
+    return markers
+
+
+_MARKER_DISPATCH_CACHE: dict = {}
+
+
+def _marker_dispatch(markers: tuple) -> tuple:
+    """
+    Build a first-character -> marker dispatch table for the marker tuple.
+
+    Returns (char_map, multi_markers). All shipped configs use
+    single-character bullet markers, which resolve with one dict probe;
+    markers longer than one character cannot be dispatched on their first
+    character alone and stay in a small scan tuple.
+    """
+    dispatch = _MARKER_DISPATCH_CACHE.get(markers)
+    if dispatch is None:
+        char_map = {}
+        multi = []
+        for marker in markers:
+            if len(marker) == 1:
+                char_map.setdefault(marker, marker)
+            else:
+                multi.append(marker)
+        dispatch = (char_map, tuple(multi))
+        _MARKER_DISPATCH_CACHE[markers] = dispatch
+    return dispatch
+
+
 def _is_list_item(text: str, mapping: dict) -> tuple[bool, str, str]:
     """
     Check if text looks like a list item.
     Returns: (is_list, list_type, cleaned_text)
-    
+
     More conservative than before - excludes common false positives.
     """
     stripped = text.lstrip()
-    
+
     # Skip if text is very short (likely not a real list item)
     if len(stripped) < 3:
         return False, "", text
-    
-    pdf_cfg = mapping.get("pdf", {})
-    markers = pdf_cfg.get("list_markers", [])
-    
-    # Check bullet markers (but not plain hyphen at start unless specified)
-    for marker in markers:
-        if marker == "-":
-            # For plain hyphen, be more careful
-            # Don't match if it looks like a range or compound word
-            if stripped.startswith("- "):
-                # Check it's not a number range like "- 50" 
-                remainder = stripped[2:].strip()
-                if remainder and not remainder[0].isdigit():
-                    return True, "itemized", remainder or text.strip()
-        elif stripped.startswith(marker):
+
+    char_map, multi_markers = _marker_dispatch(_list_markers(mapping))
+
+    # Check bullet markers with one first-character hash lookup instead of
+    # a startswith probe per configured marker
+    marker = char_map.get(stripped[0])
+    if marker == "-":
+        # For plain hyphen, be more careful
+        # Don't match if it looks like a range or compound word
+        if stripped.startswith("- "):
+            # Check it's not a number range like "- 50"
+            remainder = stripped[2:].strip()
+            if remainder and not remainder[0].isdigit():
+                return True, "itemized", remainder or text.strip()
+    elif marker is not None:
+        remainder = stripped[1:].strip()
+        # Ensure there's actual content after marker
+        if remainder:
+            return True, "itemized", remainder
+    for marker in multi_markers:
+        if stripped.startswith(marker):
             remainder = stripped[len(marker):].strip()
-            # Ensure there's actual content after marker
             if remainder:
                 return True, "itemized", remainder
     
-    # Check ordered list patterns
-    if ORDERED_LIST_RE.match(stripped):
+    # Check ordered list patterns (hand-rolled matcher; the remainder is
+    # sliced off the match end instead of a second regex pass via .sub)
+    end = _match_ordered(stripped)
+    if end != -1:
         # Extra validation: avoid common abbreviations
         # Check if this looks like "A. Smith" or "Dr. Jones"
-        match = ORDERED_LIST_RE.match(stripped)
-        if match:
-            marker_text = match.group(0).strip()
-            remainder = ORDERED_LIST_RE.sub("", stripped, count=1).strip()
-            
-            # If marker is a single letter and next word is capitalized,
-            # might be a name (e.g., "A. Smith")
-            if len(marker_text) == 2 and marker_text[0].isupper():
-                words = remainder.split()
-                if words and words[0] and words[0][0].isupper() and len(words[0]) > 2:
-                    # Likely a name like "A. Smith", not a list
-                    return False, "", text
-            
-            if remainder:
-                return True, "ordered", remainder
-    
+        marker_text = stripped[:end].rstrip()
+        remainder = stripped[end:].strip()
+
+        # If marker is a single letter and next word is capitalized,
+        # might be a name (e.g., "A. Smith")
+        if len(marker_text) == 2 and marker_text[0].isupper():
+            words = remainder.split()
+            if words and words[0] and words[0][0].isupper() and len(words[0]) > 2:
+                # Likely a name like "A. Smith", not a list
+                return False, "", text
+
+        if remainder:
+            return True, "ordered", remainder
+
     return False, "", text
 
 
-def _detect_list_sequence(entries: Sequence, start_idx: int, mapping: dict) -> tuple[bool, str, int]:
+def _detect_list_sequence(entries: Sequence, start_idx: int, mapping: dict,
+                          classifications: Optional[dict] = None) -> tuple[bool, str, int]:
     """
     Look ahead to confirm this is actually a list by checking for consecutive items.
-    
+
     Args:
         entries: Sequence of entry dictionaries (will be converted to Line objects via _line_of)
         start_idx: Starting index in entries
         mapping: Font mapping dictionary
-    
+        classifications: Optional text -> _is_list_item result memo. Lookahead
+            windows from consecutive start indices overlap, so a caller-shared
+            memo classifies each line once per pass instead of once per window.
+
     Returns: (is_list, list_type, num_items)
     """
     if start_idx >= len(entries):
         return False, "", 0
-    
+
     # Skip non-text/line entries
     if entries[start_idx].get("kind") not in ("text", "line"):
         return False, "", 0
-    
+
+    if classifications is None:
+        classifications = {}
+
     first_line = _line_of(entries[start_idx])
-    matched, list_type, _ = _is_list_item(first_line.text, mapping)
-    
+    result = classifications.get(first_line.text)
+    if result is None:
+        result = _is_list_item(first_line.text, mapping)
+        classifications[first_line.text] = result
+    matched, list_type, _ = result
+
     if not matched:
         return False, "", 0
     
@@ -1677,7 +1788,11 @@ def _detect_list_sequence(entries: Sequence, start_idx: int, mapping: dict) -> t
             break
         
         # Check if this line is also a list item of the same type
-        is_item, item_type, _ = _is_list_item(line.text, mapping)
+        result = classifications.get(line.text)
+        if result is None:
+            result = _is_list_item(line.text, mapping)
+            classifications[line.text] = result
+        is_item, item_type, _ = result
         if is_item and item_type == list_type:
             consecutive_items += 1
         else:
@@ -2286,6 +2401,8 @@ def label_blocks(pdfxml_path: str, mapping: dict, pdf_path: Optional[str] = None
 
     idx = 0
     N = len(entries)
+    # Shared across all lookahead windows in this pass (see _detect_list_sequence)
+    list_classifications: dict = {}
     while idx < N:
         entry = entries[idx]
 
@@ -2471,13 +2588,8 @@ def label_blocks(pdfxml_path: str, mapping: dict, pdf_path: Optional[str] = None
         text = (line.text or "").strip()
         
         # BUT: Don't filter single uppercase letters when in index mode (alphabet headers)
-        is_potential_alphabet_header = (
-            in_index_section and
-            len(text) == 1 and 
-            text.isupper() and 
-            text.isalpha()
-        )
-        
+        is_potential_alphabet_header = in_index_section and text in _ALPHABET_SET
+
         try:
             if not is_potential_alphabet_header:
                 if _is_header_footer_enhanced(line, repeated_patterns, copyright_patterns, seen_copyright):
@@ -2544,7 +2656,7 @@ def label_blocks(pdfxml_path: str, mapping: dict, pdf_path: Optional[str] = None
                 continue
             # Check if this is an alphabet header (single uppercase letter)
             # These should stay in index mode and be processed as index_letter blocks
-            if len(text) == 1 and text.isupper() and text.isalpha():
+            if text in _ALPHABET_SET:
                 # This is an alphabet header - let it be processed by index_letter_re check below
                 # Don't exit index mode, don't skip
                 pass
@@ -2911,7 +3023,8 @@ def label_blocks(pdfxml_path: str, mapping: dict, pdf_path: Optional[str] = None
             continue
 
         # ── List item (with lookahead confirmation)
-        is_list, list_type, num_items = _detect_list_sequence(entries, idx, mapping)
+        is_list, list_type, num_items = _detect_list_sequence(entries, idx, mapping,
+                                                              list_classifications)
         if is_list:
             # Process all confirmed list items
             if current_para:
@@ -2922,7 +3035,11 @@ def label_blocks(pdfxml_path: str, mapping: dict, pdf_path: Optional[str] = None
             # Add all consecutive list items
             for list_idx in range(idx, min(idx + num_items, len(entries))):
                 list_line = _line_of(entries[list_idx])
-                _, item_type, item_text = _is_list_item(list_line.text, mapping)
+                result = list_classifications.get(list_line.text)
+                if result is None:
+                    result = _is_list_item(list_line.text, mapping)
+                    list_classifications[list_line.text] = result
+                _, item_type, item_text = result
                 
                 blocks.append({
                     "label": "list_item",
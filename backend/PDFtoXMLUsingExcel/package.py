@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import hashlib
 import logging
+import os
 import re
 import shutil
 import string
@@ -63,6 +64,19 @@ class ImageMetadata:
 
 
 
+def _walk_files(directory) -> Iterable[os.DirEntry]:
+    """Yield a DirEntry for every file under ``directory``, recursively.
+
+    os.scandir hands back entries with cached stat results, halving the
+    syscalls of an equivalent ``rglob('*')`` + ``is_dir()`` walk.
+    """
+    for entry in os.scandir(directory):
+        if entry.is_dir():
+            yield from _walk_files(entry.path)
+        else:
+            yield entry
+
+
 def _local_name(element: etree._Element) -> str:
     tag = element.tag
     if not isinstance(tag, str):
@@ -1941,18 +1955,16 @@ def package_docbook(
             media_count = 0
             media_errors = 0
             if multi_media_dir.exists():
-                for media_file in sorted(multi_media_dir.rglob("*")):
-                    if media_file.is_dir():
-                        continue
-                    rel_path = media_file.relative_to(multi_media_dir)
+                for media_file in sorted(_walk_files(multi_media_dir), key=lambda e: e.path):
+                    rel_path = Path(media_file.path).relative_to(multi_media_dir)
                     arcname = f"MultiMedia/{rel_path.as_posix()}"
                     try:
-                        # Verify file is readable before adding to ZIP
-                        if not media_file.exists() or media_file.stat().st_size == 0:
+                        # DirEntry carries a cached stat - no extra syscalls here
+                        if media_file.stat().st_size == 0:
                             logger.warning(f"Skipping invalid media file: {arcname}")
                             media_errors += 1
                             continue
-                        zf.write(media_file, arcname)
+                        zf.write(media_file.path, arcname)
                         media_count += 1
                         logger.debug(f"Added media file to ZIP: {arcname}")
                     except Exception as e:
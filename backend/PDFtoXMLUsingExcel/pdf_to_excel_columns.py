@@ -1,6 +1,7 @@
 import os
 import subprocess
 import xml.etree.ElementTree as ET
+import numpy as np
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 import statistics
@@ -1077,6 +1078,7 @@ def group_col0_by_vertical_gap(fragments, typical_line_height, page_width=None,
 
     # Sort by baseline (top to bottom)
     sorted_frags = sorted(fragments, key=lambda f: f["baseline"])
+    n = len(sorted_frags)
 
     # Maximum vertical gap to consider fragments as part of the same ColID 0 group
     # Use 1.5x typical line height as threshold (same as paragraph detection)
@@ -1091,59 +1093,37 @@ def group_col0_by_vertical_gap(fragments, typical_line_height, page_width=None,
     # In this zone, narrow continuation lines should inherit parent's ColID 0
     footnote_threshold = page_height * 0.75 if page_height else float('inf')
 
-    i = 0
-    while i < len(sorted_frags):
-        current = sorted_frags[i]
-
-        # Only process if current fragment has ColID 0
-        if current["col_id"] != 0:
-            i += 1
-            continue
-
-        # Check if current fragment is in footnote zone
-        in_footnote_zone = current.get("top", 0) >= footnote_threshold
-
-        # Current fragment has ColID 0, check subsequent fragments
-        j = i + 1
-        while j < len(sorted_frags):
-            next_frag = sorted_frags[j]
-
-            # Calculate vertical gap
-            current_bottom = current["top"] + current["height"]
-            next_top = next_frag["top"]
-            vertical_gap = next_top - current_bottom
-
-            # If gap is too large, stop grouping
-            if vertical_gap > max_gap:
-                break
-
-            # Check if we should propagate ColID 0 to next fragment
-            next_width = next_frag.get("width", 0)
-
-            if next_frag["col_id"] != 0:
-                # In footnote zone: propagate ColID 0 to continuation lines regardless of width
-                # Outside footnote zone: only propagate if fragment is wide enough
-                if in_footnote_zone or next_width >= min_width_for_col0:
-                    # Fragment is wide enough OR we're in footnote zone - assign ColID 0
-                    next_frag["col_id"] = 0
-                    current = next_frag
-                    # Update footnote zone status for the new current fragment
-                    in_footnote_zone = current.get("top", 0) >= footnote_threshold
-                else:
-                    # Fragment is too narrow (within a column), stop propagating
-                    break
-            elif next_frag["col_id"] == 0:
-                # Already ColID 0, continue
-                current = next_frag
-                # Update footnote zone status for the new current fragment
-                in_footnote_zone = current.get("top", 0) >= footnote_threshold
-            else:
-                break
+    # Structure-of-arrays view of the sorted fragments: the grouping walk
+    # becomes whole-array operations on four contiguous columns instead of
+    # a nested Python scan over dicts
+    tops = np.fromiter((f.get("top", 0) for f in sorted_frags), dtype=np.float64, count=n)
+    heights = np.fromiter((f.get("height", 0) for f in sorted_frags), dtype=np.float64, count=n)
+    widths = np.fromiter((f.get("width", 0) for f in sorted_frags), dtype=np.float64, count=n)
+    is_col0 = np.fromiter((f["col_id"] == 0 for f in sorted_frags), dtype=bool, count=n)
+
+    # A fragment chains onto its predecessor when the vertical gap is small
+    # enough AND it is already ColID 0, wide enough for full-width content,
+    # or the predecessor sits in the footnote zone (narrow continuation
+    # lines inherit ColID 0 there regardless of width)
+    gaps = tops[1:] - (tops[:-1] + heights[:-1])
+    link = np.empty(n, dtype=bool)
+    link[0] = False
+    link[1:] = (gaps <= max_gap) & (
+        is_col0[1:]
+        | (tops[:-1] >= footnote_threshold)
+        | (widths[1:] >= min_width_for_col0)
+    )
 
-            j += 1
+    # Runs of chained fragments are delimited where link is False. Within a
+    # run, every fragment at or after the first ColID 0 seed is reachable
+    # from it, so it inherits ColID 0 — exactly the old propagation walk
+    idx = np.arange(n)
+    run_start = np.maximum.accumulate(np.where(link, -1, idx))
+    last_seed = np.maximum.accumulate(np.where(is_col0, idx, -1))
+    new_col0 = last_seed >= run_start
 
-        # Move to the next ungrouped fragment
-        i = j if j > i + 1 else i + 1
+    for i in np.flatnonzero(new_col0 & ~is_col0):
+        sorted_frags[i]["col_id"] = 0
 
 
 def maintain_col0_within_baseline(fragments, baseline_tol):
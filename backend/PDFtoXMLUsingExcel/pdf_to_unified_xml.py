@@ -35,6 +35,8 @@ import xml.etree.ElementTree as ET
 import gc
 from typing import Dict, List, Any, Tuple, Optional
 from itertools import groupby
+from operator import itemgetter
+from copy import deepcopy
 from pathlib import Path
 
 # Import our processing modules
@@ -1374,6 +1376,23 @@ def merge_cross_page_paragraphs(
     return sorted_data
 
 
+def _parse_inner_xml(inner_xml: str) -> ET.Element:
+    """
+    Parse an inner-XML fragment by wrapping it in a temporary <root> element.
+
+    stdlib expat parsers are single-document, so the parser instance itself
+    cannot be reused across calls; this helper centralizes the parser setup
+    so the hot fragment loop only pays for the actual parse.
+    """
+    parser = ET.XMLParser()
+    # Feed the wrapper tags separately so no merged intermediate string is
+    # ever built - the fragment can be large
+    parser.feed("<root>")
+    parser.feed(inner_xml)
+    parser.feed("</root>")
+    return parser.close()
+
+
 def create_unified_xml(
     pdf_path: str,
     merged_data: Dict[int, Dict[str, Any]],
@@ -1453,8 +1472,10 @@ def create_unified_xml(
     print("\nPhase 1: Creating paragraphs for all pages...")
     all_page_data = []  # List of (page_num, page_data, page_number_id, sorted_fragments, paragraphs)
     
+    # Pop pages out of merged_data as we go so the source dicts can be
+    # reclaimed instead of staying alive next to the growing DOM
     for page_num in sorted(merged_data.keys()):
-        page_data = merged_data[page_num]
+        page_data = merged_data.pop(page_num)
 
         # Extract page number ID from dedicated page_number_fragments (not filtered fragments)
         page_number_id = extract_page_number(
@@ -1500,6 +1521,11 @@ def create_unified_xml(
             # Collect paragraphs for this page
             page_paragraphs.extend(paragraphs)
         
+        # Fragment lists are no longer needed once paragraphs are built
+        # (the paragraphs hold their own references to the fragment dicts)
+        page_data.pop("fragments", None)
+        page_data.pop("page_number_fragments", None)
+
         # Store all data for this page
         all_page_data.append((page_num, page_data, page_number_id, page_paragraphs))
     
@@ -1602,12 +1628,12 @@ def create_unified_xml(
                     # Fallback: Use old approach for single fragments or no tracking
                     # Preserve inner XML formatting (e.g., <i>, <b>, <emphasis>)
                     inner_xml = f.get("inner_xml", f["text"])
-                    if inner_xml and inner_xml != f["text"]:
+                    # Only go through the parser when there is actual markup;
+                    # '<' in s is a cheap C-level scan
+                    if inner_xml and inner_xml != f["text"] and "<" in inner_xml:
                         # Parse the inner XML and attach to text_elem
                         try:
-                            # Wrap in temporary root to parse fragments
-                            wrapped = f"<root>{inner_xml}</root>"
-                            temp_root = ET.fromstring(wrapped)
+                            temp_root = _parse_inner_xml(inner_xml)
                             # Copy text and all child elements
                             text_elem.text = temp_root.text
                             for child in temp_root:
@@ -1627,43 +1653,50 @@ def create_unified_xml(
         html_page_height = page_data.get("page_height", 0)
         media_page_width = page_data.get("media_page_width", 0)
         media_page_height = page_data.get("media_page_height", 0)
-        
+
+        # Skip the transform pass entirely when the scale factors are identity
+        # (common for born-digital PDFs where both extractors agree on page size)
+        needs_transform = (
+            media_page_width > 0 and media_page_height > 0
+            and (media_page_width != html_page_width or media_page_height != html_page_height)
+        )
+
         # Media section - all images positioned by bbox reading order
         # CRITICAL: Transform coordinates from PyMuPDF space to HTML space
         media_elem = ET.SubElement(page_elem, "media")
-        # Sort by reading_block, then reading_order
-        for elem, reading_order, reading_block in sorted(page_data["media"], key=lambda x: (x[2], x[1])):
-            # Clone the element
-            new_elem = ET.SubElement(media_elem, elem.tag, elem.attrib)
+        # Sort by reading_block, then reading_order (itemgetter is a C-level key)
+        for elem, reading_order, reading_block in sorted(page_data["media"], key=itemgetter(2, 1)):
+            # Clone the whole subtree at once (deepcopy runs in C) instead of
+            # re-parenting children one by one
+            new_elem = deepcopy(elem)
             new_elem.set("reading_order", str(reading_order))
             new_elem.set("reading_block", str(reading_block))
-            
+
             # Transform coordinates to HTML space to match text coordinates
-            if media_page_width > 0 and media_page_height > 0:
+            if needs_transform:
                 transform_media_coords_to_html(
-                    new_elem, 
-                    media_page_width, 
+                    new_elem,
+                    media_page_width,
                     media_page_height,
                     html_page_width,
                     html_page_height
                 )
-            
-            # Copy all child elements
-            for child in elem:
-                new_elem.append(child)
+
+            media_elem.append(new_elem)
 
         # Tables section
         # CRITICAL: Transform coordinates from PyMuPDF space to HTML space
         tables_elem = ET.SubElement(page_elem, "tables")
-        # Sort by reading_block, then reading_order
-        for elem, reading_order, reading_block in sorted(page_data["tables"], key=lambda x: (x[2], x[1])):
-            # Clone the element
-            new_elem = ET.SubElement(tables_elem, elem.tag, elem.attrib)
+        # Sort by reading_block, then reading_order (itemgetter is a C-level key)
+        for elem, reading_order, reading_block in sorted(page_data["tables"], key=itemgetter(2, 1)):
+            # Clone the whole subtree at once (deepcopy runs in C) instead of
+            # re-parenting children one by one
+            new_elem = deepcopy(elem)
             new_elem.set("reading_order", str(reading_order))
             new_elem.set("reading_block", str(reading_block))
-            
+
             # Transform coordinates to HTML space to match text coordinates
-            if media_page_width > 0 and media_page_height > 0:
+            if needs_transform:
                 transform_media_coords_to_html(
                     new_elem,
                     media_page_width,
@@ -1671,10 +1704,14 @@ def create_unified_xml(
                     html_page_width,
                     html_page_height
                 )
-            
-            # Copy all child elements
-            for child in elem:
-                new_elem.append(child)
+
+            tables_elem.append(new_elem)
+
+        # Page subtree is built - the remaining media/table source elements
+        # are dead weight; drop them so peak memory tracks the DOM only
+        page_data.clear()
+
+    gc.collect()  # Free the popped page structures before serializing
 
     # Write XML
     tree = ET.ElementTree(root)
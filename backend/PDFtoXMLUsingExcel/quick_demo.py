@@ -5,6 +5,7 @@ Quick demonstration of the RittDoc Compliance Pipeline
 This creates a simple test package and runs the full pipeline on it.
 """
 
+import hashlib
 import sys
 import tempfile
 import zipfile
@@ -74,36 +75,51 @@ def create_test_package() -> Path:
     para2 = etree.SubElement(chapter2, "para")
     para2.text = "Another direct para under chapter."
     
+    # Serialize everything up front so we can hash the payload
+    doctype = '<!DOCTYPE book SYSTEM "RittDocBook.dtd">'
+    xml_str = etree.tostring(book, encoding='unicode', pretty_print=True)
+    full_xml = f'<?xml version="1.0" encoding="UTF-8"?>\n{doctype}\n{xml_str}'
+    chapter1_str = etree.tostring(chapter1, encoding='unicode', pretty_print=True)
+    chapter2_str = etree.tostring(chapter2, encoding='unicode', pretty_print=True)
+
+    # The payload is deterministic - skip the rebuild if the existing ZIP
+    # was generated from identical content (hash stored in a sidecar file)
+    test_zip = Path("test_package.zip")
+    sidecar = Path("test_package.zip.sha")
+    content_hash = hashlib.sha256(
+        (full_xml + chapter1_str + chapter2_str).encode('utf-8')
+    ).hexdigest()
+
+    if test_zip.exists() and sidecar.exists():
+        if sidecar.read_text().strip() == content_hash:
+            print(f"✓ Reusing existing test package: {test_zip} (content unchanged)")
+            print()
+            return test_zip
+
     # Create temporary directory and files
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_path = Path(tmpdir)
-        
+
         # Write Book.XML
         book_xml = tmp_path / "Book.XML"
-        
-        # Add DOCTYPE declaration
-        doctype = '<!DOCTYPE book SYSTEM "RittDocBook.dtd">'
-        xml_str = etree.tostring(book, encoding='unicode', pretty_print=True)
-        full_xml = f'<?xml version="1.0" encoding="UTF-8"?>\n{doctype}\n{xml_str}'
-        
         book_xml.write_text(full_xml, encoding='utf-8')
-        
+
         # Create separate chapter files (referenced by Book.XML)
         ch1_xml = tmp_path / "ch0001.xml"
-        chapter1_str = etree.tostring(chapter1, encoding='unicode', pretty_print=True)
         ch1_xml.write_text(f'<?xml version="1.0" encoding="UTF-8"?>\n{chapter1_str}', encoding='utf-8')
-        
+
         ch2_xml = tmp_path / "ch0002.xml"
-        chapter2_str = etree.tostring(chapter2, encoding='unicode', pretty_print=True)
         ch2_xml.write_text(f'<?xml version="1.0" encoding="UTF-8"?>\n{chapter2_str}', encoding='utf-8')
-        
+
         # Create ZIP package
-        test_zip = Path("test_package.zip")
-        with zipfile.ZipFile(test_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
+        # Throwaway test archive - skip compression entirely
+        with zipfile.ZipFile(test_zip, 'w', zipfile.ZIP_STORED) as zf:
             zf.write(book_xml, "Book.XML")
             zf.write(ch1_xml, "ch0001.xml")
             zf.write(ch2_xml, "ch0002.xml")
-        
+
+        sidecar.write_text(content_hash)
+
         print(f"✓ Created test package: {test_zip}")
         print(f"  - Book.XML (main file)")
         print(f"  - ch0001.xml (chapter 1 with violations)")
@@ -169,6 +185,9 @@ def main():
         # Cleanup
         if test_zip.exists():
             test_zip.unlink()
+            sidecar = test_zip.with_suffix('.zip.sha')
+            if sidecar.exists():
+                sidecar.unlink()
             print(f"\n✓ Cleaned up test package: {test_zip}")
         
         return 0 if success else 1
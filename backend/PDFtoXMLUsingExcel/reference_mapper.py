@@ -10,18 +10,81 @@ This module provides:
 - Export/import of mapping data for debugging and validation
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Set, Optional, Tuple
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, List, Set, Optional, Tuple
 from pathlib import Path
+import dbm
 import json
 import logging
+import os
+import sys
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+
+# orjson (Rust encoder) is much faster for large mappings; fall back to
+# stdlib json when it isn't installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# MessagePack is the preferred checkpoint format between pipeline stages
+# for large books (binary, no textual escaping); JSON stays the debug format
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class Stat(IntEnum):
+    """Indexes into the mapper's counter array"""
+    TOTAL_IMAGES = 0
+    VECTOR_IMAGES = 1
+    RASTER_IMAGES = 2
+    TOTAL_LINKS = 3
+    BROKEN_LINKS = 4
+    UNREFERENCED_RESOURCES = 5
+
+
+# Dict keys for the exported statistics view, aligned with Stat indexes
+_STAT_KEYS = (
+    'total_images',
+    'vector_images',
+    'raster_images',
+    'total_links',
+    'broken_links',
+    'unreferenced_resources',
+)
+
+
+def _bump_image_stats(counts: 'array', kwargs: dict) -> None:
+    counts[Stat.TOTAL_IMAGES] += 1
+    if kwargs.get('is_vector'):
+        counts[Stat.VECTOR_IMAGES] += 1
+    if kwargs.get('is_raster'):
+        counts[Stat.RASTER_IMAGES] += 1
+
+
+# Per-type stats hooks keep add_resource O(1) as resource types multiply
+_STATS_HOOKS: Dict[str, Callable[['array', dict], None]] = {
+    'image': _bump_image_stats,
+}
+
+
+@lru_cache(maxsize=8192)
+def _normalize_label(label: str) -> str:
+    """Normalize a figure label for lookup (case-insensitive, single spaces)"""
+    return " ".join(label.lower().split())
+
+
+@dataclass(slots=True)
 class ResourceReference:
     """Tracks a single resource through all renaming stages"""
     original_path: str          # Original path in source (e.g., "OEBPS/images/fig1.png")
@@ -34,6 +97,10 @@ class ResourceReference:
     first_seen_in: Optional[str] = None  # Chapter/file where first referenced
     referenced_in: List[str] = field(default_factory=list)  # All chapters referencing this
 
+    # Set mirror of referenced_in for O(1) membership checks; rebuilt in
+    # __post_init__ and excluded from serialization
+    referenced_in_set: Set[str] = field(default_factory=set, repr=False, compare=False)
+
     # Image-specific metadata
     is_vector: bool = False
     is_raster: bool = False
@@ -53,17 +120,65 @@ class ResourceReference:
     exists_in_output: bool = False
     all_references_updated: bool = False
 
+    def __post_init__(self):
+        self.referenced_in_set = set(self.referenced_in)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        # Hand-written rather than asdict(): asdict() reflects on fields()
+        # and deep-copies on every call, which dominates export_to_json
+        # when there are thousands of resources
+        return {
+            'original_path': self.original_path,
+            'original_filename': self.original_filename,
+            'intermediate_name': self.intermediate_name,
+            'final_name': self.final_name,
+            'resource_type': self.resource_type,
+            'first_seen_in': self.first_seen_in,
+            'referenced_in': list(self.referenced_in),
+            'is_vector': self.is_vector,
+            'is_raster': self.is_raster,
+            'width': self.width,
+            'height': self.height,
+            'file_size': self.file_size,
+            'figure_label': self.figure_label,
+            'caption_text': self.caption_text,
+            'chapter_name': self.chapter_name,
+            'chapter_id': self.chapter_id,
+            'image_number_in_chapter': self.image_number_in_chapter,
+            'exists_in_source': self.exists_in_source,
+            'exists_in_output': self.exists_in_output,
+            'all_references_updated': self.all_references_updated,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ResourceReference':
-        """Create from dictionary"""
-        return cls(**data)
+        """Create from dictionary without cls(**data) kwargs-unpacking overhead"""
+        return cls(
+            data['original_path'],
+            data['original_filename'],
+            data['intermediate_name'],
+            data.get('final_name'),
+            data.get('resource_type', 'image'),
+            data.get('first_seen_in'),
+            data.get('referenced_in') or [],
+            is_vector=data.get('is_vector', False),
+            is_raster=data.get('is_raster', False),
+            width=data.get('width'),
+            height=data.get('height'),
+            file_size=data.get('file_size'),
+            figure_label=data.get('figure_label'),
+            caption_text=data.get('caption_text'),
+            chapter_name=data.get('chapter_name'),
+            chapter_id=data.get('chapter_id'),
+            image_number_in_chapter=data.get('image_number_in_chapter'),
+            exists_in_source=data.get('exists_in_source', True),
+            exists_in_output=data.get('exists_in_output', False),
+            all_references_updated=data.get('all_references_updated', False),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkReference:
     """Tracks internal document links"""
     original_href: str          # Original link (e.g., "chapter02.xhtml#section1")
@@ -73,11 +188,23 @@ class LinkReference:
     resolved: bool = False
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'original_href': self.original_href,
+            'source_chapter': self.source_chapter,
+            'target_chapter': self.target_chapter,
+            'target_anchor': self.target_anchor,
+            'resolved': self.resolved,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'LinkReference':
-        return cls(**data)
+        return cls(
+            data['original_href'],
+            data['source_chapter'],
+            data.get('target_chapter'),
+            data.get('target_anchor'),
+            data.get('resolved', False),
+        )
 
 
 class ReferenceMapper:
@@ -91,16 +218,19 @@ class ReferenceMapper:
         self.links: List[LinkReference] = []
         self.chapter_map: Dict[str, str] = {}  # original_file → chapter_id
         self.figure_label_map: Dict[str, str] = {}  # figure_label → original_path
+        self._by_intermediate: Dict[str, ResourceReference] = {}  # intermediate_name → ref
+        self._chapter_map_sorted: Optional[List[Tuple[str, str]]] = None  # report cache
 
-        # Statistics
-        self.stats = {
-            'total_images': 0,
-            'vector_images': 0,
-            'raster_images': 0,
-            'total_links': 0,
-            'broken_links': 0,
-            'unreferenced_resources': 0,
-        }
+        # Statistics: a flat typed counter array (indexed by Stat) avoids
+        # per-increment PyLong boxing and dict probes on the hot paths;
+        # the stats property materializes the dict view on demand
+        self._stat_counts = array('q', [0] * len(Stat))
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters as the familiar statistics dict"""
+        counts = self._stat_counts
+        return {key: counts[i] for i, key in enumerate(_STAT_KEYS)}
 
     def add_resource(self,
                      original_path: str,
@@ -121,7 +251,14 @@ class ReferenceMapper:
         Returns:
             ResourceReference object
         """
-        original_filename = Path(original_path).name
+        # Source paths are always zip-style '/' paths; rpartition avoids the
+        # PurePath construction overhead per resource
+        original_filename = original_path.rpartition('/')[2]
+
+        # resource_type is a tiny closed vocabulary shared by thousands of
+        # references - intern it so duplicates share one string object and
+        # equality checks become pointer compares
+        resource_type = sys.intern(resource_type)
 
         ref = ResourceReference(
             original_path=original_path,
@@ -134,32 +271,33 @@ class ReferenceMapper:
         )
 
         self.resources[original_path] = ref
+        self._by_intermediate[intermediate_name] = ref
 
-        if resource_type == "image":
-            self.stats['total_images'] += 1
-            if kwargs.get('is_vector'):
-                self.stats['vector_images'] += 1
-            if kwargs.get('is_raster'):
-                self.stats['raster_images'] += 1
+        hook = _STATS_HOOKS.get(resource_type)
+        if hook is not None:
+            hook(self._stat_counts, kwargs)
 
-        logger.debug(f"Registered resource: {original_path} → {intermediate_name}")
+        logger.debug("Registered resource: %s → %s", original_path, intermediate_name)
         return ref
 
     def update_final_name(self, original_path: str, final_name: str) -> None:
         """Update the final name for a resource after packaging"""
-        if original_path in self.resources:
-            self.resources[original_path].final_name = final_name
-            logger.debug(f"Updated final name: {original_path} → {final_name}")
+        ref = self.resources.get(original_path)
+        if ref is not None:
+            ref.final_name = final_name
+            logger.debug("Updated final name: %s → %s", original_path, final_name)
         else:
-            logger.warning(f"Attempted to update final name for unknown resource: {original_path}")
+            logger.warning("Attempted to update final name for unknown resource: %s", original_path)
 
     def add_reference(self, original_path: str, referenced_in: str) -> None:
         """Record that a resource is referenced in a specific chapter"""
-        if original_path in self.resources:
-            if referenced_in not in self.resources[original_path].referenced_in:
-                self.resources[original_path].referenced_in.append(referenced_in)
+        ref = self.resources.get(original_path)
+        if ref is not None:
+            if referenced_in not in ref.referenced_in_set:
+                ref.referenced_in_set.add(referenced_in)
+                ref.referenced_in.append(referenced_in)
         else:
-            logger.warning(f"Reference to unknown resource: {original_path} in {referenced_in}")
+            logger.warning("Reference to unknown resource: %s in %s", original_path, referenced_in)
 
     def add_link(self,
                  original_href: str,
@@ -175,29 +313,32 @@ class ReferenceMapper:
             resolved=target_chapter is not None
         )
         self.links.append(link)
-        self.stats['total_links'] += 1
+        self._stat_counts[Stat.TOTAL_LINKS] += 1
 
         if not link.resolved:
-            self.stats['broken_links'] += 1
+            self._stat_counts[Stat.BROKEN_LINKS] += 1
 
         return link
 
     def register_chapter(self, original_file: str, chapter_id: str) -> None:
         """Map original XHTML file to chapter ID"""
-        self.chapter_map[original_file] = chapter_id
-        logger.debug(f"Registered chapter mapping: {original_file} → {chapter_id}")
+        self.chapter_map[original_file] = sys.intern(chapter_id)
+        self._chapter_map_sorted = None  # invalidate the report cache
+        logger.debug("Registered chapter mapping: %s → %s", original_file, chapter_id)
 
     def get_final_name(self, original_path: str) -> Optional[str]:
         """Get the final name for a resource"""
-        if original_path in self.resources:
-            return self.resources[original_path].final_name
-        return None
+        ref = self.resources.get(original_path)
+        return ref.final_name if ref is not None else None
 
     def get_intermediate_name(self, original_path: str) -> Optional[str]:
         """Get the intermediate name for a resource"""
-        if original_path in self.resources:
-            return self.resources[original_path].intermediate_name
-        return None
+        ref = self.resources.get(original_path)
+        return ref.intermediate_name if ref is not None else None
+
+    def get_resource_by_intermediate_name(self, intermediate_name: str) -> Optional[ResourceReference]:
+        """Get resource by its intermediate name (O(1) reverse lookup)"""
+        return self._by_intermediate.get(intermediate_name)
 
     def get_chapter_id(self, original_file: str) -> Optional[str]:
         """Get chapter ID for an original XHTML file"""
@@ -211,31 +352,29 @@ class ReferenceMapper:
                               chapter_id: Optional[str] = None,
                               image_number: Optional[int] = None) -> None:
         """Update figure-specific metadata for a resource"""
-        if original_path not in self.resources:
-            logger.warning(f"Attempted to update figure metadata for unknown resource: {original_path}")
+        ref = self.resources.get(original_path)
+        if ref is None:
+            logger.warning("Attempted to update figure metadata for unknown resource: %s", original_path)
             return
 
-        ref = self.resources[original_path]
         if figure_label:
             ref.figure_label = figure_label
-            # Normalize figure label for lookup (case-insensitive, remove extra spaces)
-            normalized_label = " ".join(figure_label.lower().split())
-            self.figure_label_map[normalized_label] = original_path
+            self.figure_label_map[_normalize_label(figure_label)] = original_path
         if caption_text:
             ref.caption_text = caption_text
         if chapter_name:
             ref.chapter_name = chapter_name
         if chapter_id:
-            ref.chapter_id = chapter_id
+            # A few hundred chapter ids are shared across thousands of refs
+            ref.chapter_id = sys.intern(chapter_id)
         if image_number is not None:
             ref.image_number_in_chapter = image_number
 
-        logger.debug(f"Updated figure metadata for {original_path}: label={figure_label}")
+        logger.debug("Updated figure metadata for %s: label=%s", original_path, figure_label)
 
     def get_resource_by_figure_label(self, figure_label: str) -> Optional[ResourceReference]:
         """Get resource by figure label (case-insensitive)"""
-        normalized_label = " ".join(figure_label.lower().split())
-        original_path = self.figure_label_map.get(normalized_label)
+        original_path = self.figure_label_map.get(_normalize_label(figure_label))
         if original_path:
             return self.resources.get(original_path)
         return None
@@ -260,24 +399,28 @@ class ReferenceMapper:
         """
         errors = []
 
-        # Check that all resources have final names
+        # One directory read instead of a stat() syscall per resource
+        mm_dir = output_dir / "MultiMedia"
+        try:
+            present = frozenset(e.name for e in os.scandir(mm_dir))
+        except FileNotFoundError:
+            present = frozenset()
+
+        # Single pass: final-name/existence checks and unreferenced counting
         for path, ref in self.resources.items():
             if ref.final_name is None:
                 errors.append(f"Resource has no final name: {path}")
             else:
                 # Check if final file exists
-                final_path = output_dir / "MultiMedia" / ref.final_name
-                if final_path.exists():
+                if ref.final_name in present:
                     ref.exists_in_output = True
                 else:
                     ref.exists_in_output = False
-                    errors.append(f"Final resource not found: {final_path}")
+                    errors.append(f"Final resource not found: {mm_dir / ref.final_name}")
 
-        # Check for unreferenced resources
-        for path, ref in self.resources.items():
             if not ref.referenced_in:
-                self.stats['unreferenced_resources'] += 1
-                logger.warning(f"Unreferenced resource: {path}")
+                self._stat_counts[Stat.UNREFERENCED_RESOURCES] += 1
+                logger.warning("Unreferenced resource: %s", path)
 
         # Check links
         for link in self.links:
@@ -287,9 +430,9 @@ class ReferenceMapper:
         is_valid = len(errors) == 0
         return is_valid, errors
 
-    def export_to_json(self, output_path: Path) -> None:
-        """Export complete mapping to JSON for debugging and validation"""
-        data = {
+    def _build_export_data(self) -> dict:
+        """Build the serializable mapping structure shared by all export formats"""
+        return {
             'metadata': {
                 'created': datetime.now().isoformat(),
                 'total_resources': len(self.resources),
@@ -301,48 +444,101 @@ class ReferenceMapper:
             'statistics': self.stats,
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _load_import_data(self, data: dict) -> None:
+        """Rebuild mapper state from a deserialized mapping structure"""
+        self.resources = {
+            path: ResourceReference.from_dict(ref_data)
+            for path, ref_data in data['resources'].items()
+        }
+        self._by_intermediate = {
+            ref.intermediate_name: ref for ref in self.resources.values()
+        }
+        self.links = [LinkReference.from_dict(link_data) for link_data in data['links']]
+        self.chapter_map = data['chapter_map']
+        self._chapter_map_sorted = None
+        imported_stats = data['statistics']
+        for i, key in enumerate(_STAT_KEYS):
+            self._stat_counts[i] = imported_stats.get(key, 0)
 
-        logger.info(f"Exported reference mapping to {output_path}")
+    def export_to_json(self, output_path: Path) -> None:
+        """Export complete mapping to JSON for debugging and validation"""
+        data = self._build_export_data()
+
+        if HAS_ORJSON:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        logger.info("Exported reference mapping to %s", output_path)
 
     def import_from_json(self, input_path: Path) -> None:
         """Import mapping from JSON"""
         with open(input_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        self.resources = {
-            path: ResourceReference.from_dict(ref_data)
-            for path, ref_data in data['resources'].items()
-        }
-        self.links = [LinkReference.from_dict(link_data) for link_data in data['links']]
-        self.chapter_map = data['chapter_map']
-        self.stats = data['statistics']
+        self._load_import_data(data)
+        logger.info("Imported reference mapping from %s", input_path)
+
+    def export_to_msgpack(self, output_path: Path) -> None:
+        """Export complete mapping as MessagePack (binary checkpoint format)"""
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack is not installed - use export_to_json instead")
+
+        output_path.write_bytes(msgpack.packb(self._build_export_data(), use_bin_type=True))
+        logger.info("Exported reference mapping to %s", output_path)
+
+    def import_from_msgpack(self, input_path: Path) -> None:
+        """Import mapping from MessagePack"""
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack is not installed - use import_from_json instead")
+
+        self._load_import_data(msgpack.unpackb(input_path.read_bytes(), raw=False))
+        logger.info("Imported reference mapping from %s", input_path)
+
+    def export_to_dbm(self, db_path: Path) -> None:
+        """
+        Persist resources to an on-disk dbm store keyed by original_path.
+
+        Worker processes open the store read-only via SharedResourceStore
+        instead of receiving a pickled copy of the whole mapper, so memory
+        stays at one mapper regardless of worker count.
+        """
+        with dbm.open(str(db_path), 'n') as db:
+            for path, ref in self.resources.items():
+                db[path.encode('utf-8')] = _encode_resource(ref.to_dict())
 
-        logger.info(f"Imported reference mapping from {input_path}")
+        logger.info("Exported %d resources to dbm store %s", len(self.resources), db_path)
 
     def get_statistics(self) -> Dict:
         """Get current statistics"""
-        return self.stats.copy()
+        return self.stats
 
     def generate_report(self) -> str:
         """Generate a human-readable report of the mapping state"""
+        counts = self._stat_counts
         lines = [
             "=" * 80,
             "REFERENCE MAPPING REPORT",
             "=" * 80,
             f"Total Resources: {len(self.resources)}",
-            f"  - Images: {self.stats['total_images']}",
-            f"    - Vector: {self.stats['vector_images']}",
-            f"    - Raster: {self.stats['raster_images']}",
-            f"Total Links: {self.stats['total_links']}",
-            f"  - Broken: {self.stats['broken_links']}",
-            f"Unreferenced Resources: {self.stats['unreferenced_resources']}",
+            f"  - Images: {counts[Stat.TOTAL_IMAGES]}",
+            f"    - Vector: {counts[Stat.VECTOR_IMAGES]}",
+            f"    - Raster: {counts[Stat.RASTER_IMAGES]}",
+            f"Total Links: {counts[Stat.TOTAL_LINKS]}",
+            f"  - Broken: {counts[Stat.BROKEN_LINKS]}",
+            f"Unreferenced Resources: {counts[Stat.UNREFERENCED_RESOURCES]}",
             "",
             "Chapter Mappings:",
         ]
 
-        for original, chapter_id in sorted(self.chapter_map.items()):
+        # Sorting the whole map per report is wasted work when reports are
+        # emitted repeatedly; cache until register_chapter invalidates
+        if self._chapter_map_sorted is None:
+            self._chapter_map_sorted = sorted(self.chapter_map.items())
+
+        for original, chapter_id in self._chapter_map_sorted:
             lines.append(f"  {original} → {chapter_id}")
 
         lines.extend([
@@ -350,7 +546,7 @@ class ReferenceMapper:
             "Resource Mappings (first 10):",
         ])
 
-        for i, (path, ref) in enumerate(list(self.resources.items())[:10]):
+        for path, ref in islice(self.resources.items(), 10):
             lines.append(f"  {path}")
             lines.append(f"    → intermediate: {ref.intermediate_name}")
             lines.append(f"    → final: {ref.final_name or 'NOT SET'}")
@@ -363,6 +559,52 @@ class ReferenceMapper:
         return "\n".join(lines)
 
 
+def _encode_resource(data: dict) -> bytes:
+    """Encode one resource record for the dbm store"""
+    if HAS_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _decode_resource(raw: bytes) -> dict:
+    """Decode one resource record from the dbm store"""
+    if HAS_MSGPACK:
+        return msgpack.unpackb(raw, raw=False)
+    return json.loads(raw)
+
+
+class SharedResourceStore:
+    """
+    Read-only view of a dbm-backed resource mapping for worker processes.
+
+    Each worker opens the store independently (the OS page cache is shared),
+    avoiding N_workers x mapper_size memory when chapter processing fans out
+    across a process pool.
+    """
+
+    def __init__(self, db_path: Path):
+        self._db = dbm.open(str(db_path), 'r')
+
+    def get(self, original_path: str) -> Optional[ResourceReference]:
+        raw = self._db.get(original_path.encode('utf-8'))
+        if raw is None:
+            return None
+        return ResourceReference.from_dict(_decode_resource(raw))
+
+    def get_final_name(self, original_path: str) -> Optional[str]:
+        ref = self.get(original_path)
+        return ref.final_name if ref is not None else None
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'SharedResourceStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 # Global mapper instance for use across pipeline
 _global_mapper: Optional[ReferenceMapper] = None
 
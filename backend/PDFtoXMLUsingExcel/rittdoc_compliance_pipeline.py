@@ -18,19 +18,109 @@ Usage:
 """
 
 import argparse
+import io
+import logging
+import os
+from collections import Counter
+import struct
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from lxml import etree
 
+# Optional: ISA-L provides a SIMD-accelerated, zlib-compatible deflate that
+# is typically 3-4x faster on the extract/recompress cycles that dominate
+# large packages. Route zipfile's compression through it when available.
+try:
+    from isal import isal_zlib
+    zipfile.zlib = isal_zlib
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
 # Import all the tools we need
 from comprehensive_dtd_fixer import ComprehensiveDTDFixer, process_zip_package as fix_zip_package
 from validate_with_entity_tracking import EntityTrackingValidator
 from validation_report import ValidationReportGenerator, VerificationItem
-from add_toc_to_book import add_toc_to_book_xml
+from add_toc_to_book import add_toc_to_book_content
+
+logger = logging.getLogger(__name__)
+
+
+# Worker-process state for parallel chapter fixing. Compiled DTD objects
+# don't pickle, so each worker builds its own fixer once at startup.
+_worker_fixer = None
+
+
+def _init_fix_worker(dtd_path_str: str):
+    """Initializer for fix worker processes: build one fixer per process."""
+    global _worker_fixer
+    _worker_fixer = ComprehensiveDTDFixer(Path(dtd_path_str))
+
+
+def _fix_one_chapter(task: Tuple[str, bytes]) -> Tuple[str, bytes, int, List[str]]:
+    """Fix a single chapter document (as bytes) in a worker process."""
+    member_name, data = task
+    # No pretty-printing here: intermediate passes get re-parsed with
+    # remove_blank_text anyway, and the pipeline reformats once at the end
+    fixed, num_fixes, fix_descriptions = _worker_fixer.fix_chapter_bytes(
+        data, Path(member_name).name, pretty_print=False
+    )
+    return member_name, fixed, num_fixes, fix_descriptions
+
+
+def _copy_zip_member_raw(
+    zin: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    zout: zipfile.ZipFile
+):
+    """
+    Copy one unchanged member between archives without recompressing it.
+
+    Transfers the already-compressed payload straight from the source, so
+    untouched images/fonts/binaries don't pay an inflate+deflate round trip
+    on every fix iteration. Falls back to a decompress/recompress writestr
+    if the raw transfer can't be done (e.g. zip64 members).
+    """
+    try:
+        # Locate the member's compressed payload in the source archive
+        zin.fp.seek(info.header_offset)
+        header = struct.unpack(
+            zipfile.structFileHeader, zin.fp.read(zipfile.sizeFileHeader)
+        )
+        name_len = header[zipfile._FH_FILENAME_LENGTH]
+        extra_len = header[zipfile._FH_EXTRA_FIELD_LENGTH]
+        zin.fp.seek(
+            info.header_offset + zipfile.sizeFileHeader + name_len + extra_len
+        )
+        raw = zin.fp.read(info.compress_size)
+
+        # Write a fresh local header followed by the raw bytes
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.external_attr = info.external_attr
+        new_info.internal_attr = info.internal_attr
+        new_info.create_system = info.create_system
+        new_info.CRC = info.CRC
+        new_info.compress_size = info.compress_size
+        new_info.file_size = info.file_size
+        new_info.flag_bits = info.flag_bits & ~0x08  # sizes known; no descriptor
+
+        dest = zout.fp
+        new_info.header_offset = dest.tell()
+        dest.write(new_info.FileHeader(zip64=False))
+        dest.write(raw)
+
+        zout.filelist.append(new_info)
+        zout.NameToInfo[new_info.filename] = new_info
+        zout.start_dir = dest.tell()
+        zout._didModify = True
+    except Exception:
+        zout.writestr(info, zin.read(info.filename))
 
 
 class RittDocCompliancePipeline:
@@ -38,6 +128,11 @@ class RittDocCompliancePipeline:
     
     def __init__(self, dtd_path: Path):
         self.dtd_path = dtd_path
+        # Compile the DTD once; every validation pass (up to
+        # 2*max_iterations+1 of them) reuses the in-memory grammar
+        self.compiled_dtd = etree.DTD(str(dtd_path))
+        # One fixer for all iterations - its constructor compiles the DTD too
+        self.fixer = ComprehensiveDTDFixer(dtd_path)
         self.stats = {
             'initial_errors': 0,
             'final_errors': 0,
@@ -79,9 +174,12 @@ class RittDocCompliancePipeline:
         print("STEP 1: INITIAL VALIDATION (PRE-FIX)")
         print("=" * 80)
         
-        validator = EntityTrackingValidator(self.dtd_path)
+        validator = EntityTrackingValidator(self.dtd_path, dtd=self.compiled_dtd)
         pre_report = validator.validate_zip_package(input_zip, output_report_path=None)
-        self.stats['initial_errors'] = pre_report.get_error_count()
+        # Count once; stats['initial_errors'] is re-baselined per iteration,
+        # so the true starting figure lives in this local
+        initial_error_count = pre_report.get_error_count()
+        self.stats['initial_errors'] = initial_error_count
         
         print(f"\n✗ Found {self.stats['initial_errors']} validation errors before fixes")
         
@@ -95,94 +193,54 @@ class RittDocCompliancePipeline:
         # Show error breakdown
         self._print_error_breakdown(pre_report)
         
-        # Step 2: Apply fixes (iterative)
-        working_zip = input_zip
-        
-        for iteration in range(1, max_iterations + 1):
-            print("\n" + "=" * 80)
-            print(f"STEP 2.{iteration}: APPLYING COMPREHENSIVE DTD FIXES (Iteration {iteration})")
-            print("=" * 80)
-            
-            # Create temporary output for this iteration
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
-                iteration_output = Path(tmp.name)
-            
-            # Apply comprehensive fixes
-            fixer = ComprehensiveDTDFixer(self.dtd_path)
-            fix_stats = self._apply_comprehensive_fixes(working_zip, iteration_output, fixer)
-            
-            self.stats['total_fixes_applied'] += fix_stats.get('total_fixes', 0)
-            self.stats['files_processed'] = fix_stats.get('files_processed', 0)
-            self.stats['files_fixed'] = fix_stats.get('files_fixed', 0)
-            
-            print(f"\nIteration {iteration} Summary:")
-            print(f"  Files processed: {fix_stats.get('files_processed', 0)}")
-            print(f"  Files fixed: {fix_stats.get('files_fixed', 0)}")
-            print(f"  Fixes applied: {fix_stats.get('total_fixes', 0)}")
-            
-            # Step 3: Post-fix validation
-            print("\n" + "=" * 80)
-            print(f"STEP 3.{iteration}: POST-FIX VALIDATION (Iteration {iteration})")
-            print("=" * 80)
-            
-            post_report = validator.validate_zip_package(iteration_output, output_report_path=None)
-            errors_after = post_report.get_error_count()
-            
-            print(f"\nValidation after iteration {iteration}:")
-            print(f"  Errors remaining: {errors_after}")
-            print(f"  Errors fixed: {self.stats['initial_errors'] - errors_after}")
-            print(f"  Improvement: {((self.stats['initial_errors'] - errors_after) / self.stats['initial_errors'] * 100):.1f}%")
-            
-            # If no errors, we're done!
-            if errors_after == 0:
-                print("\n✓ Package is now fully DTD-compliant!")
-                # Copy to final output
-                import shutil
-                shutil.copy2(iteration_output, output_zip)
-                iteration_output.unlink()
-                self.stats['final_errors'] = 0
-                self.stats['validation_passes'] = iteration
-                break
-            
-            # If no improvement, stop iterating
-            if errors_after >= self.stats['initial_errors']:
-                print(f"\n⚠ No improvement after iteration {iteration}. Stopping.")
-                import shutil
-                shutil.copy2(iteration_output, output_zip)
-                iteration_output.unlink()
-                self.stats['final_errors'] = errors_after
-                self.stats['validation_passes'] = iteration
-                break
-            
-            # Update working zip for next iteration
-            working_zip = iteration_output
-            self.stats['initial_errors'] = errors_after  # Update baseline
-            
-            if iteration == max_iterations:
-                # Last iteration - save as output
-                import shutil
-                shutil.copy2(iteration_output, output_zip)
-                iteration_output.unlink()
-                self.stats['final_errors'] = errors_after
-                self.stats['validation_passes'] = iteration
-        
-        # Step 4: Add TOC to Book.XML (if not present)
+        # Step 2: Apply fixes (iterative, entirely in memory). The package
+        # is read once, the fixer iterates over the in-memory documents
+        # until it reaches a fixed point (or the iteration cap), TOC
+        # insertion is fused in, and the output ZIP is written once
         print("\n" + "=" * 80)
-        print("STEP 4: ADDING TABLE OF CONTENTS")
+        print("STEP 2: APPLYING COMPREHENSIVE DTD FIXES")
         print("=" * 80)
-        
-        self._add_toc_to_package(output_zip)
-        
-        # Step 5: Final validation and report
+
+        self.fixer.reset()
+        fix_stats = self._apply_comprehensive_fixes(
+            input_zip, output_zip, self.fixer,
+            max_iterations=max_iterations,
+            add_toc=True
+        )
+
+        self.stats['total_fixes_applied'] = fix_stats.get('total_fixes', 0)
+        self.stats['files_processed'] = fix_stats.get('files_processed', 0)
+        self.stats['files_fixed'] = fix_stats.get('files_fixed', 0)
+        self.stats['validation_passes'] = fix_stats.get('iterations', 0)
+
+        print(f"\nFix Summary:")
+        print(f"  Files processed: {fix_stats.get('files_processed', 0)}")
+        print(f"  Files fixed: {fix_stats.get('files_fixed', 0)}")
+        print(f"  Fixes applied: {fix_stats.get('total_fixes', 0)}")
+        print(f"  Fix iterations: {fix_stats.get('iterations', 0)}")
+
+        # Step 3: Final validation and report
         print("\n" + "=" * 80)
-        print("STEP 5: FINAL VALIDATION & REPORT GENERATION")
+        print("STEP 3: FINAL VALIDATION & REPORT GENERATION")
         print("=" * 80)
         
-        final_report = validator.validate_zip_package(
-            output_zip, 
-            output_report_path=output_zip.parent / f"{output_zip.stem}_validation_report.xlsx"
-        )
-        
+        report_path = output_zip.parent / f"{output_zip.stem}_validation_report.xlsx"
+
+        if fix_stats.get('total_fixes', 0) == 0 and not fix_stats.get('toc_added'):
+            # Nothing was fixed and no TOC was inserted - the output content
+            # is identical to what the pre-fix pass already validated, so
+            # revalidating it against the same cached grammar is pure waste
+            print("Package content unchanged - reusing pre-fix validation results")
+            final_report = pre_report
+            if final_report.has_errors():
+                final_report.generate_excel_report(report_path, "RittDoc Package")
+                print(f"\n✓ Validation report saved: {report_path}")
+        else:
+            final_report = validator.validate_zip_package(
+                output_zip,
+                output_report_path=report_path
+            )
+
         self.stats['final_errors'] = final_report.get_error_count()
         
         # Print final summary
@@ -192,16 +250,16 @@ class RittDocCompliancePipeline:
         print(f"Files processed:        {self.stats['files_processed']}")
         print(f"Files fixed:            {self.stats['files_fixed']}")
         print(f"Total fixes applied:    {self.stats['total_fixes_applied']}")
-        print(f"Validation iterations:  {self.stats['validation_passes']}")
+        print(f"Fix iterations:         {self.stats['validation_passes']}")
         print()
-        print(f"Initial errors:         {pre_report.get_error_count()}")
+        print(f"Initial errors:         {initial_error_count}")
         print(f"Final errors:           {self.stats['final_errors']}")
-        print(f"Errors fixed:           {pre_report.get_error_count() - self.stats['final_errors']}")
-        
+        print(f"Errors fixed:           {initial_error_count - self.stats['final_errors']}")
+
         if self.stats['final_errors'] == 0:
             improvement = 100.0
         else:
-            improvement = ((pre_report.get_error_count() - self.stats['final_errors']) / pre_report.get_error_count() * 100)
+            improvement = ((initial_error_count - self.stats['final_errors']) / initial_error_count * 100)
         
         print(f"Improvement:            {improvement:.1f}%")
         print()
@@ -226,13 +284,12 @@ class RittDocCompliancePipeline:
         if not report.has_errors():
             return
         
-        # Group by error type
-        error_types = {}
-        for error in report.errors:
-            error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-        
+        # Group by error type (most_common uses a heap - O(n log 10),
+        # not a full sort)
+        error_types = Counter(error.error_type for error in report.errors)
+
         print("\nError breakdown by type:")
-        for error_type, count in sorted(error_types.items(), key=lambda x: -x[1])[:10]:
+        for error_type, count in error_types.most_common(10):
             print(f"  {error_type}: {count}")
         
         # Show sample errors
@@ -242,89 +299,226 @@ class RittDocCompliancePipeline:
                 location = f"line {error.line_number}" if error.line_number else "unknown location"
                 print(f"  {i}. {error.xml_file} ({location}): {error.error_description[:80]}")
     
+    @staticmethod
+    def _book_has_toc(book_bytes: bytes) -> bool:
+        """Check Book.XML bytes for a <toc> element without a full DOM build"""
+        # Cheap negative probe first: if the substring never appears there
+        # is certainly no toc element, and no parse is needed at all
+        if b'<toc' not in book_bytes:
+            return False
+
+        for _, elem in etree.iterparse(
+            io.BytesIO(book_bytes),
+            events=('start',),
+            tag='toc',
+            resolve_entities=False,
+            load_dtd=False,
+            collect_ids=False,
+            huge_tree=True
+        ):
+            elem.clear()
+            return True
+        return False
+
     def _apply_comprehensive_fixes(
-        self, 
-        input_zip: Path, 
+        self,
+        input_zip: Path,
         output_zip: Path,
-        fixer: ComprehensiveDTDFixer
+        fixer: ComprehensiveDTDFixer,
+        max_iterations: int = 1,
+        add_toc: bool = False,
+        compresslevel: Optional[int] = None
     ) -> Dict:
-        """Apply comprehensive DTD fixes to a package"""
-        
+        """
+        Apply comprehensive DTD fixes to a package.
+
+        The archive is read once; the fixer iterates over the in-memory
+        chapter documents until a pass applies zero fixes (or max_iterations
+        is reached); the output ZIP is written once at the end. No
+        per-iteration extract/re-zip cycles.
+
+        When add_toc is True, TOC insertion into Book.XML is fused into the
+        same write pass. compresslevel is forwarded to the output ZipFile.
+        """
+
         stats = {
             'files_processed': 0,
             'files_fixed': 0,
-            'total_fixes': 0
+            'total_fixes': 0,
+            'iterations': 0,
+            'toc_added': False
         }
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            extract_dir = tmp_path / "extracted"
-            extract_dir.mkdir()
-            
-            # Extract ZIP
-            print(f"Extracting {input_zip.name}...")
-            with zipfile.ZipFile(input_zip, 'r') as zf:
-                zf.extractall(extract_dir)
-            
-            # Find all chapter XML files
-            chapter_files = list(extract_dir.rglob("ch*.xml"))
-            print(f"Found {len(chapter_files)} chapter files to fix")
-            
-            for chapter_file in sorted(chapter_files):
-                stats['files_processed'] += 1
-                
-                num_fixes, fix_descriptions = fixer.fix_chapter_file(chapter_file, chapter_file.name)
-                
-                if num_fixes > 0:
-                    stats['files_fixed'] += 1
-                    stats['total_fixes'] += num_fixes
-                    print(f"  ✓ {chapter_file.name}: Applied {num_fixes} fix(es)")
-            
+
+        # Patch chapter members in memory and stream everything else through
+        # unchanged - no tempdir, no extractall, no directory re-walk
+        with zipfile.ZipFile(input_zip, 'r') as zin:
+            # Archive member order is already deterministic, so no sort is
+            # needed for stable logs - the fixes themselves are
+            # order-independent
+            members = [info for info in zin.infolist() if not info.is_dir()]
+            chapter_docs = {
+                info.filename: zin.read(info.filename)
+                for info in members
+                if Path(info.filename).name.startswith('ch')
+                and info.filename.endswith('.xml')
+            }
+            print(f"Found {len(chapter_docs)} chapter files to fix")
+
+            stats['files_processed'] = len(chapter_docs)
+            files_ever_fixed = set()
+
+            # Chapter fixes are independent (each touches only its own
+            # document), so fan them out across processes when there's more
+            # than one. One pool serves all iterations, so each worker
+            # compiles its DTD exactly once
+            executor = None
+            try:
+                if len(chapter_docs) > 1:
+                    max_workers = min(32, os.cpu_count() or 1, len(chapter_docs))
+                    executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_fix_worker,
+                        initargs=(str(self.dtd_path),)
+                    )
+
+                for iteration in range(1, max_iterations + 1):
+                    stats['iterations'] = iteration
+                    iteration_fixes = 0
+
+                    print(f"\nFix pass {iteration}...")
+
+                    if executor is not None:
+                        results = executor.map(
+                            _fix_one_chapter, list(chapter_docs.items())
+                        )
+                    else:
+                        results = [
+                            (member_name,) + fixer.fix_chapter_bytes(
+                                data, Path(member_name).name, pretty_print=False
+                            )
+                            for member_name, data in list(chapter_docs.items())
+                        ]
+
+                    for member_name, fixed, num_fixes, fix_descriptions in results:
+                        chapter_docs[member_name] = fixed
+                        if num_fixes > 0:
+                            files_ever_fixed.add(member_name)
+                            iteration_fixes += num_fixes
+                            # Lazy %s formatting: skipped entirely unless
+                            # DEBUG is enabled - this line runs per file
+                            logger.debug("✓ %s: Applied %d fix(es)",
+                                         Path(member_name).name, num_fixes)
+
+                    stats['total_fixes'] += iteration_fixes
+
+                    if iteration_fixes == 0:
+                        print("  No fixes needed - fixed point reached")
+                        break
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+
+            stats['files_fixed'] = len(files_ever_fixed)
+
+            # Fix passes serialize without indentation (each pass re-parses
+            # the result, so pretty-printing there is pure waste). Reformat
+            # each chapter once here so the written package stays readable
+            reformat_parser = etree.XMLParser(
+                remove_blank_text=True, collect_ids=False, huge_tree=True
+            )
+            for member_name, data in chapter_docs.items():
+                try:
+                    root = etree.fromstring(data, reformat_parser)
+                    chapter_docs[member_name] = etree.tostring(
+                        root,
+                        encoding='utf-8',
+                        xml_declaration=True,
+                        pretty_print=True
+                    )
+                except etree.XMLSyntaxError:
+                    # Leave the bytes exactly as the fix pass produced them
+                    pass
+
+            fixed_members = chapter_docs
+
+            # Fused TOC insertion: patch Book.XML in memory alongside the
+            # chapter fixes so it rides the same write pass
+            if add_toc:
+                book_members = [
+                    info.filename for info in members
+                    if Path(info.filename).name == "Book.XML"
+                ]
+                if book_members:
+                    book_member = book_members[0]
+                    try:
+                        book_bytes = zin.read(book_member)
+                        if not self._book_has_toc(book_bytes):
+                            chapter_texts = {
+                                Path(name).name: data.decode('utf-8', errors='replace')
+                                for name, data in fixed_members.items()
+                            }
+                            new_content = add_toc_to_book_content(
+                                book_bytes.decode('utf-8'), chapter_texts
+                            )
+                            if new_content is not None:
+                                fixed_members[book_member] = new_content.encode('utf-8')
+                                stats['toc_added'] = True
+                                print("  ✓ Added TOC to Book.XML")
+                            else:
+                                print("  ⚠ Failed to add TOC to Book.XML")
+                    except Exception as e:
+                        print(f"  ⚠ Error adding TOC: {e}")
+
             # Recreate ZIP
             print(f"\nCreating fixed ZIP: {output_zip.name}...")
-            with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_path in extract_dir.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(extract_dir)
-                        zf.write(file_path, arcname)
-        
+            with zipfile.ZipFile(
+                output_zip, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+            ) as zout:
+                for info in members:
+                    if info.filename in fixed_members:
+                        zout.writestr(info.filename, fixed_members[info.filename])
+                    else:
+                        _copy_zip_member_raw(zin, info, zout)
+
         return stats
     
     def _add_toc_to_package(self, zip_path: Path):
-        """Add TOC to Book.XML in the package"""
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            extract_dir = tmp_path / "extracted"
-            extract_dir.mkdir()
-            
-            # Extract ZIP
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(extract_dir)
-            
-            # Find Book.XML
-            book_xml_files = list(extract_dir.rglob("Book.XML"))
-            if not book_xml_files:
+        """Add TOC to Book.XML in the package (entirely in memory)"""
+
+        new_book_bytes = None
+
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            book_members = [
+                name for name in zf.namelist() if Path(name).name == "Book.XML"
+            ]
+            if not book_members:
                 print("  ⚠ Book.XML not found - skipping TOC addition")
                 return
-            
-            book_xml_path = book_xml_files[0]
-            
-            # Check if TOC already exists
+
+            book_member = book_members[0]
+
+            # Check if TOC already exists - probe straight from the archive
             try:
-                tree = etree.parse(str(book_xml_path))
-                root = tree.getroot()
-                if root.find('.//toc') is not None:
+                book_bytes = zf.read(book_member)
+                if self._book_has_toc(book_bytes):
                     print("  ℹ TOC already exists in Book.XML - skipping")
                     return
             except Exception as e:
                 print(f"  ⚠ Error checking for existing TOC: {e}")
                 return
-            
-            # Add TOC
+
+            # Add TOC, reading chapter titles straight from the archive
             try:
-                success = add_toc_to_book_xml(book_xml_path, book_xml_path.parent)
-                if success:
+                chapter_texts = {
+                    Path(name).name: zf.read(name).decode('utf-8', errors='replace')
+                    for name in zf.namelist()
+                    if Path(name).name.startswith('ch') and name.endswith('.xml')
+                }
+                new_content = add_toc_to_book_content(
+                    book_bytes.decode('utf-8'), chapter_texts
+                )
+                if new_content is not None:
+                    new_book_bytes = new_content.encode('utf-8')
                     print("  ✓ Added TOC to Book.XML")
                 else:
                     print("  ⚠ Failed to add TOC to Book.XML")
@@ -332,17 +526,30 @@ class RittDocCompliancePipeline:
             except Exception as e:
                 print(f"  ⚠ Error adding TOC: {e}")
                 return
-            
-            # Recreate ZIP with updated Book.XML
-            print(f"  Updating ZIP package...")
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_path in extract_dir.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(extract_dir)
-                        zf.write(file_path, arcname)
+
+        # Rewrite only Book.XML; stream every other member unchanged
+        print(f"  Updating ZIP package...")
+        with tempfile.NamedTemporaryFile(
+            suffix='.zip', delete=False, dir=zip_path.parent
+        ) as tmp:
+            updated_zip = Path(tmp.name)
+
+        with zipfile.ZipFile(zip_path, 'r') as zin, \
+             zipfile.ZipFile(updated_zip, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for info in zin.infolist():
+                if info.is_dir():
+                    continue
+                if info.filename == book_member:
+                    zout.writestr(info.filename, new_book_bytes)
+                else:
+                    _copy_zip_member_raw(zin, info, zout)
+
+        os.replace(updated_zip, zip_path)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(
         description="Complete RittDoc DTD Compliance Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -4,8 +4,14 @@ Test to verify that narrow continuation lines in the footnote zone
 inherit their parent's col_id=0 assignment.
 """
 
+import sys
+
 from pdf_to_excel_columns import group_col0_by_vertical_gap
 
+# Emoji-heavy status output; make sure a C-locale CI console can encode it
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8")
+
 def test_footnote_zone_continuation():
     """
     Test that narrow continuation lines in the footnote zone get col_id=0
@@ -49,19 +55,29 @@ def test_footnote_zone_continuation():
         {"top": 1033, "height": 15, "baseline": 1048, "width": 314, "col_id": 1},  # Currently wrong!
     ]
     
-    print("\nBEFORE grouping:")
-    for i, frag in enumerate(fragments):
-        in_zone = "📍 IN FOOTNOTE ZONE" if frag["top"] >= footnote_threshold else ""
-        print(f"  Fragment {i}: top={frag['top']:4.0f}, width={frag['width']:3.0f}, col_id={frag['col_id']} {in_zone}")
-    
+    # Index the fragments once: tops are unique, so O(1) dict lookups and
+    # precomputed zone flags replace the linear scans in the loops and
+    # verification checks below
+    by_top = {f["top"]: f for f in fragments}
+    in_zone_flags = [f["top"] >= footnote_threshold for f in fragments]
+
+    # Per-fragment lines are buffered and flushed with one write each, so
+    # the loops do not pay a stdio lock/flush per print
+    lines = ["\nBEFORE grouping:"]
+    for i, (frag, in_zone) in enumerate(zip(fragments, in_zone_flags)):
+        zone_note = "📍 IN FOOTNOTE ZONE" if in_zone else ""
+        lines.append(f"  Fragment {i}: top={frag['top']:4.0f}, width={frag['width']:3.0f}, col_id={frag['col_id']} {zone_note}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
     # Apply the fix
     group_col0_by_vertical_gap(fragments, typical_line_height, page_width=page_width, page_height=page_height)
-    
-    print("\nAFTER grouping:")
-    for i, frag in enumerate(fragments):
-        in_zone = "📍 IN FOOTNOTE ZONE" if frag["top"] >= footnote_threshold else ""
-        status = "✅" if frag["top"] >= footnote_threshold and frag["col_id"] == 0 else ""
-        print(f"  Fragment {i}: top={frag['top']:4.0f}, width={frag['width']:3.0f}, col_id={frag['col_id']} {status} {in_zone}")
+
+    lines = ["\nAFTER grouping:"]
+    for i, (frag, in_zone) in enumerate(zip(fragments, in_zone_flags)):
+        zone_note = "📍 IN FOOTNOTE ZONE" if in_zone else ""
+        status = "✅" if in_zone and frag["col_id"] == 0 else ""
+        lines.append(f"  Fragment {i}: top={frag['top']:4.0f}, width={frag['width']:3.0f}, col_id={frag['col_id']} {status} {zone_note}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Verify the fix worked
     print("\n" + "="*70)
@@ -69,7 +85,7 @@ def test_footnote_zone_continuation():
     print("="*70)
     
     # Check that narrow fragment at top=939 now has col_id=0
-    frag_939 = [f for f in fragments if f["top"] == 939][0]
+    frag_939 = by_top[939]
     if frag_939["col_id"] == 0:
         print("✅ PASS: Narrow fragment at top=939 (width=120) correctly has col_id=0")
     else:
@@ -77,7 +93,7 @@ def test_footnote_zone_continuation():
         return False
     
     # Check that narrow fragment at top=1033 now has col_id=0
-    frag_1033 = [f for f in fragments if f["top"] == 1033][0]
+    frag_1033 = by_top[1033]
     if frag_1033["col_id"] == 0:
         print("✅ PASS: Narrow fragment at top=1033 (width=314) correctly has col_id=0")
     else:
@@ -85,7 +101,7 @@ def test_footnote_zone_continuation():
         return False
     
     # Check that all fragments in footnote zone have col_id=0
-    footnote_frags = [f for f in fragments if f["top"] >= footnote_threshold]
+    footnote_frags = [f for f, in_zone in zip(fragments, in_zone_flags) if in_zone]
     all_col0 = all(f["col_id"] == 0 for f in footnote_frags)
     if all_col0:
         print(f"✅ PASS: All {len(footnote_frags)} fragments in footnote zone have col_id=0")
@@ -94,7 +110,7 @@ def test_footnote_zone_continuation():
         return False
     
     # Check that fragment above footnote zone kept col_id=1
-    frag_851 = [f for f in fragments if f["top"] == 851][0]
+    frag_851 = by_top[851]
     if frag_851["col_id"] == 1:
         print("✅ PASS: Fragment above footnote zone (top=851) correctly kept col_id=1")
     else:
@@ -3,6 +3,50 @@
 Test the fixed implementation by extracting just the function
 """
 
+import sys
+from operator import itemgetter
+
+import numpy as np
+
+# C-implemented sort key: builds the (baseline, left) tuple without a
+# Python-level lambda call per comparison
+_BASELINE_LEFT = itemgetter("baseline", "left")
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _assign_blocks_kernel(sorted_ids):
+    """Single-pass block numbering: increment on every col_id change."""
+    out = np.empty(sorted_ids.size, dtype=np.int32)
+    block = 0
+    prev = -2147483648
+    for i in range(sorted_ids.size):
+        cid = sorted_ids[i]
+        if cid != prev:
+            block += 1
+            prev = cid
+        out[i] = block
+    return out
+
+
+def _assign_blocks_numpy(sorted_ids):
+    """NumPy fallback: cumulative sum over the col_id change mask."""
+    changes = np.empty(sorted_ids.size, dtype=bool)
+    changes[0] = True
+    changes[1:] = sorted_ids[1:] != sorted_ids[:-1]
+    return np.cumsum(changes)
+
+
+if HAS_NUMBA:
+    _assign_blocks = njit(cache=True)(_assign_blocks_kernel)
+else:
+    _assign_blocks = _assign_blocks_numpy
+
+
 def assign_reading_order_blocks(fragments, rows):
     """
     FIXED VERSION: Assign reading_order_block to all fragments based on vertical position and col_id.
@@ -20,9 +64,15 @@ def assign_reading_order_blocks(fragments, rows):
       Title(0) → Col1(1) → Col2(2) → Footnote(0)  =  Blocks: 1, 2, 3, 4
       Title(0) → Col1(1) → Figure(0) → Col2(2)    =  Blocks: 1, 2, 3, 4
       Col1(1) → Col2(2) → Col3(3)                 =  Blocks: 1, 2, 3
+
+    Returns:
+        The (baseline, left) sort permutation as a NumPy index array, so
+        callers needing reading order can iterate fragments[i] for i in
+        it instead of re-sorting. None when no sort was performed (empty
+        input or trivially single-block pages).
     """
     if not fragments:
-        return
+        return None
 
     # Collect all unique col_ids
     all_col_ids = sorted({f["col_id"] for f in fragments if f["col_id"] is not None})
@@ -31,26 +81,33 @@ def assign_reading_order_blocks(fragments, rows):
     if len(all_col_ids) <= 1:
         for f in fragments:
             f["reading_order_block"] = 1
-        return
+        return None
 
     # Sort fragments by baseline (top to bottom), then by left position
-    # This ensures we process fragments in natural reading order
-    sorted_frags = sorted(fragments, key=lambda f: (f["baseline"], f["left"]))
-    
+    # This ensures we process fragments in natural reading order.
+    # Done on contiguous NumPy arrays: lexsort avoids a Python key lambda
+    # per comparison, and block numbers fall out of a cumulative sum over
+    # the col_id change mask (None maps to -1 so it still breaks blocks)
+    n = len(fragments)
+    baselines = np.fromiter((f["baseline"] for f in fragments), dtype=np.float64, count=n)
+    lefts = np.fromiter((f["left"] for f in fragments), dtype=np.float64, count=n)
+    col_ids = np.fromiter(
+        (f["col_id"] if f["col_id"] is not None else -1 for f in fragments),
+        dtype=np.int32, count=n
+    )
+
+    order = np.lexsort((lefts, baselines))
+    sorted_ids = col_ids[order]
+
     # Assign blocks based on col_id transitions
     # When col_id changes, we're moving to a new logical block
-    block_num = 0
-    prev_col_id = None
-    
-    for frag in sorted_frags:
-        current_col_id = frag["col_id"]
-        
-        # Start a new block when col_id changes
-        if current_col_id != prev_col_id:
-            block_num += 1
-            prev_col_id = current_col_id
-        
-        frag["reading_order_block"] = block_num
+    # (numba kernel when available, NumPy cumsum fallback otherwise)
+    blocks = _assign_blocks(sorted_ids)
+
+    for pos, idx in enumerate(order):
+        fragments[idx]["reading_order_block"] = int(blocks[pos])
+
+    return order
 
 
 def create_test_fragments():
@@ -83,7 +140,7 @@ def create_test_fragments():
     return fragments
 
 
-def test_standard_two_column():
+def scenario_standard_two_column():
     """Test standard two-column layout without interleaved content"""
     fragments = [
         {"text": "Title", "col_id": 0, "baseline": 100, "left": 72, "reading_order_block": None},
@@ -95,12 +152,12 @@ def test_standard_two_column():
     assign_reading_order_blocks(fragments, [])
     
     expected = [1, 2, 3, 4]  # Title → Col1 → Col2 → Footnote
-    actual = [f["reading_order_block"] for f in sorted(fragments, key=lambda x: (x["baseline"], x["left"]))]
+    actual = [f["reading_order_block"] for f in sorted(fragments, key=_BASELINE_LEFT)]
     
     return expected == actual
 
 
-def test_single_column():
+def scenario_single_column():
     """Test single column layout"""
     fragments = [
         {"text": "Line 1", "col_id": 1, "baseline": 100, "left": 72, "reading_order_block": None},
@@ -114,27 +171,49 @@ def test_single_column():
     return all(f["reading_order_block"] == 1 for f in fragments)
 
 
-def test_interleaved_content():
+def scenario_interleaved_content():
     """Test complex interleaved content (main test)"""
     fragments = create_test_fragments()
     assign_reading_order_blocks(fragments, [])
     
     expected = [1, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 5]
-    actual = [f["reading_order_block"] for f in sorted(fragments, key=lambda x: (x["baseline"], x["left"]))]
+    actual = [f["reading_order_block"] for f in sorted(fragments, key=_BASELINE_LEFT)]
     
     return expected == actual
 
 
-def print_detailed_results(fragments):
-    """Print detailed results"""
+# --- pytest integration ---------------------------------------------------
+# One parametrized test covers all scenarios under pytest; the script
+# driver below remains for manual runs.
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+    @pytest.mark.parametrize("scenario", [
+        scenario_single_column,
+        scenario_standard_two_column,
+        scenario_interleaved_content,
+    ], ids=lambda f: f.__name__)
+    def test_block_scenarios(scenario):
+        assert scenario()
+
+
+def print_detailed_results(fragments, order=None):
+    """Print detailed results, reusing a sort permutation when given"""
     print("\n" + "=" * 80)
     print("DETAILED RESULTS")
     print("=" * 80)
     print(f"{'Block':<8} {'ColID':<8} {'Baseline':<10} {'Text':<50}")
     print("-" * 80)
-    
-    for f in sorted(fragments, key=lambda x: (x["baseline"], x["left"])):
-        print(f"{f['reading_order_block']:<8} {f['col_id']:<8} {f['baseline']:<10} {f['text']:<50}")
+
+    ordered = (fragments[i] for i in order) if order is not None else sorted(fragments, key=_BASELINE_LEFT)
+    # One buffered write for the whole table instead of a print per row
+    sys.stdout.write("".join(
+        f"{f['reading_order_block']:<8} {f['col_id']:<8} {f['baseline']:<10} {f['text']:<50}\n"
+        for f in ordered
+    ))
 
 
 if __name__ == "__main__":
@@ -144,9 +223,9 @@ if __name__ == "__main__":
     
     # Run all tests
     tests = [
-        ("Single column layout", test_single_column),
-        ("Standard two-column layout", test_standard_two_column),
-        ("Interleaved content (complex)", test_interleaved_content),
+        ("Single column layout", scenario_single_column),
+        ("Standard two-column layout", scenario_standard_two_column),
+        ("Interleaved content (complex)", scenario_interleaved_content),
     ]
     
     all_passed = True
@@ -157,10 +236,11 @@ if __name__ == "__main__":
         if not result:
             all_passed = False
     
-    # Show detailed results for the complex case
+    # Show detailed results for the complex case, reusing the sort
+    # permutation returned by the block assignment
     fragments = create_test_fragments()
-    assign_reading_order_blocks(fragments, [])
-    print_detailed_results(fragments)
+    order = assign_reading_order_blocks(fragments, [])
+    print_detailed_results(fragments, order)
     
     # Summary
     print("\n" + "=" * 80)
@@ -9,12 +9,16 @@ Tests:
 """
 
 import re
+import string
 try:
     from lxml import etree
     HAS_LXML = True
 except ImportError:
     HAS_LXML = False
 
+# Single A-Z letters, mirroring heuristics_Nov3._ALPHABET_SET
+_ALPHABET_SET = frozenset(string.ascii_uppercase)
+
 
 def test_alphabet_headers_not_filtered():
     """Test that alphabet headers (including C, D, I, V, X) are retained."""
@@ -47,13 +51,8 @@ def test_alphabet_headers_not_filtered():
         text = line.text.strip()
         
         # This is the new logic from the fix
-        is_potential_alphabet_header = (
-            in_index_section and
-            len(text) == 1 and 
-            text.isupper() and 
-            text.isalpha()
-        )
-        
+        is_potential_alphabet_header = in_index_section and text in _ALPHABET_SET
+
         if is_potential_alphabet_header:
             print(f"  ✓ {letter}: Would NOT be filtered (alphabet header detected)")
             passed += 1
@@ -98,7 +97,7 @@ def test_index_exit_logic():
         
         # Simulate the new exit logic
         if has_heading_font:
-            if len(text) == 1 and text.isupper() and text.isalpha():
+            if text in _ALPHABET_SET:
                 # Alphabet header - stay in index
                 exits_index = False
             elif len(text.split()) > 5:
@@ -124,6 +123,95 @@ def test_index_exit_logic():
     return failed == 0
 
 
+def _iter_index_chapters(xml_file):
+    """Yield chapter elements with role='index' from a streaming parse.
+
+    iterparse keeps only one chapter subtree in memory at a time: after
+    iteration resumes past a chapter, it is cleared and its already-seen
+    siblings are dropped from the root. Callers must therefore finish
+    with each yielded chapter before advancing the generator — collecting
+    it into a list would hand back cleared, empty elements.
+    """
+    for _, elem in etree.iterparse(xml_file, events=("end",), tag="chapter",
+                                   huge_tree=True, remove_blank_text=True):
+        if elem.get("role") == "index":
+            yield elem
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _analyze_index_chapter(index_chapter):
+    """Run the alphabet-header, entry and page-span checks on one chapter."""
+    # One iterwalk sweep collects everything the checks below need,
+    # instead of four separate traversals of the index chapter
+    bridgeheads = []
+    index_paras = []
+    varlistentries = []
+    pages_with_content = set()
+    for _, elem in etree.iterwalk(index_chapter, events=("start",)):
+        tag = elem.tag
+        if tag == "bridgehead":
+            bridgeheads.append(elem)
+        elif tag == "para":
+            if elem.get("role") == "index":
+                index_paras.append(elem)
+        elif tag == "varlistentry":
+            varlistentries.append(elem)
+        page_num = elem.get('page_num')
+        if page_num:
+            pages_with_content.add(int(page_num))
+
+    alphabet_headers = []
+    for bh in bridgeheads:
+        text = ''.join(bh.itertext()).strip()
+        if text in _ALPHABET_SET:
+            alphabet_headers.append(text)
+
+    if alphabet_headers:
+        print(f"  ✓ Found {len(alphabet_headers)} alphabet headers: {', '.join(sorted(set(alphabet_headers)))}")
+
+        # Check for the problematic letters (roman numerals)
+        roman_letters = set(['C', 'D', 'I', 'V', 'X', 'L', 'M'])
+        found_roman = roman_letters & set(alphabet_headers)
+
+        if found_roman:
+            print(f"  ✓ Roman numeral letters present: {', '.join(sorted(found_roman))}")
+            print("     (These were being filtered before the fix)")
+        else:
+            print(f"  ⚠ Roman numeral letters NOT found: {', '.join(sorted(roman_letters - found_roman))}")
+            print("     (Expected at least some of these in a full index)")
+    else:
+        print("  ⚠ No alphabet headers found")
+        print("     (Expected <bridgehead> elements for A, B, C, etc.)")
+
+    # Count index items (fall back to the alternative structure)
+    index_items = index_paras or varlistentries
+
+    if index_items:
+        print(f"  ✓ Found {len(index_items)} index entries")
+    else:
+        print("  ⚠ No index entries found")
+
+    # Check page distribution
+    if pages_with_content:
+        min_page = min(pages_with_content)
+        max_page = max(pages_with_content)
+        page_count = max_page - min_page + 1
+        print(f"  ✓ Index spans pages {min_page}-{max_page} ({page_count} pages)")
+
+        if page_count == 1:
+            print("  ⚠ WARNING: Index only spans 1 page!")
+            print("     This might indicate the bug is still present")
+            return False
+    else:
+        print("  ⚠ No page numbers found in index")
+
+    return True
+
+
 def test_docbook_output(xml_file=None):
     """Test the actual DocBook output if available."""
     if not HAS_LXML:
@@ -147,78 +235,23 @@ def test_docbook_output(xml_file=None):
     print(f"  Analyzing: {xml_file}")
     
     try:
-        tree = etree.parse(xml_file)
-        root = tree.getroot()
-        
-        # Find index chapter
-        index_chapters = root.findall(".//chapter[@role='index']")
-        
-        if not index_chapters:
+        # Stream chapters instead of loading the whole document: each
+        # index chapter must be analyzed before the generator advances
+        # and clears it, so the first one is handled inside the loop
+        index_count = 0
+        first_ok = True
+        for index_chapter in _iter_index_chapters(xml_file):
+            index_count += 1
+            if index_count == 1:
+                first_ok = _analyze_index_chapter(index_chapter)
+
+        if index_count == 0:
             print("  ✗ No index chapter found in output!")
             return False
-        
-        print(f"  ✓ Found {len(index_chapters)} index chapter(s)")
-        
-        # Check for alphabet headers
-        index_chapter = index_chapters[0]
-        bridgeheads = index_chapter.findall(".//bridgehead")
-        
-        alphabet_headers = []
-        for bh in bridgeheads:
-            text = ''.join(bh.itertext()).strip()
-            if len(text) == 1 and text.isupper() and text.isalpha():
-                alphabet_headers.append(text)
-        
-        if alphabet_headers:
-            print(f"  ✓ Found {len(alphabet_headers)} alphabet headers: {', '.join(sorted(set(alphabet_headers)))}")
-            
-            # Check for the problematic letters (roman numerals)
-            roman_letters = set(['C', 'D', 'I', 'V', 'X', 'L', 'M'])
-            found_roman = roman_letters & set(alphabet_headers)
-            
-            if found_roman:
-                print(f"  ✓ Roman numeral letters present: {', '.join(sorted(found_roman))}")
-                print("     (These were being filtered before the fix)")
-            else:
-                print(f"  ⚠ Roman numeral letters NOT found: {', '.join(sorted(roman_letters - found_roman))}")
-                print("     (Expected at least some of these in a full index)")
-        else:
-            print("  ⚠ No alphabet headers found")
-            print("     (Expected <bridgehead> elements for A, B, C, etc.)")
-        
-        # Count index items
-        index_items = index_chapter.findall(".//para[@role='index']")
-        if not index_items:
-            # Try alternative structure
-            index_items = index_chapter.findall(".//varlistentry")
-        
-        if index_items:
-            print(f"  ✓ Found {len(index_items)} index entries")
-        else:
-            print("  ⚠ No index entries found")
-        
-        # Check page distribution
-        pages_with_content = set()
-        for elem in index_chapter.iter():
-            page_num = elem.get('page_num')
-            if page_num:
-                pages_with_content.add(int(page_num))
-        
-        if pages_with_content:
-            min_page = min(pages_with_content)
-            max_page = max(pages_with_content)
-            page_count = max_page - min_page + 1
-            print(f"  ✓ Index spans pages {min_page}-{max_page} ({page_count} pages)")
-            
-            if page_count == 1:
-                print("  ⚠ WARNING: Index only spans 1 page!")
-                print("     This might indicate the bug is still present")
-                return False
-        else:
-            print("  ⚠ No page numbers found in index")
-        
-        return True
-        
+
+        print(f"  ✓ Found {index_count} index chapter(s)")
+        return first_ok
+
     except FileNotFoundError:
         print(f"  ✗ File not found: {xml_file}")
         return False
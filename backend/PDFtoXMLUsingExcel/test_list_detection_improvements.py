@@ -7,6 +7,8 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Sequence, Optional, Tuple
 
+import numpy as np
+
 # Import the improved patterns and functions
 # Note: This imports from heuristics_Nov3.py which requires lxml, so we'll mock the necessary parts
 
@@ -21,47 +23,119 @@ class Line:
     right: Optional[float] = None
     font_size: Optional[float] = 12.0
 
-# Copy the improved regex pattern
-ORDERED_LIST_RE = re.compile(r"^(?:\(?\d{1,3}[\.\)]|[A-HJ-Za-hj-z][\.\)])\s+(?=\w{2,})")
+# Copy the improved regex pattern (ASCII-only: non-ASCII digits are
+# intentionally excluded, matching heuristics_Nov3)
+ORDERED_LIST_RE = re.compile(r"^(?:\(?\d{1,3}[\.\)]|[A-HJ-Za-hj-z][\.\)])\s+(?=\w{2,})", re.ASCII)
+
+_ASCII_WS = " \t\n\r\f\v"
+
+
+def _is_ascii_word_char(c: str) -> bool:
+    """ASCII \\w: [a-zA-Z0-9_]."""
+    return c == "_" or (c.isascii() and c.isalnum())
+
+
+def _match_ordered(s: str) -> int:
+    """Hand-rolled ORDERED_LIST_RE.match; returns match end index or -1.
+
+    Mirrors heuristics_Nov3._match_ordered.
+    """
+    n = len(s)
+    j = 1 if s.startswith("(") else 0
+    k = j
+    while k < n and k - j < 3 and "0" <= s[k] <= "9":
+        k += 1
+    if k > j and k < n and (s[k] == "." or s[k] == ")"):
+        i = k + 1
+    else:
+        c = s[0] if n else ""
+        if (("A" <= c <= "H") or ("J" <= c <= "Z")
+                or ("a" <= c <= "h") or ("j" <= c <= "z")) \
+                and n > 1 and (s[1] == "." or s[1] == ")"):
+            i = 2
+        else:
+            return -1
+    start_ws = i
+    while i < n and s[i] in _ASCII_WS:
+        i += 1
+    if i == start_ws:
+        return -1
+    if i + 1 < n and _is_ascii_word_char(s[i]) and _is_ascii_word_char(s[i + 1]):
+        return i
+    return -1
+
+# Cached marker lookup, mirroring heuristics_Nov3._list_markers
+_LIST_MARKERS_CACHE: dict = {}
+
+def _list_markers(mapping: dict) -> tuple:
+    """Return the configured list markers as a cached tuple."""
+    key = id(mapping)
+    markers = _LIST_MARKERS_CACHE.get(key)
+    if markers is None:
+        markers = tuple(mapping.get("pdf", {}).get("list_markers", []))
+        _LIST_MARKERS_CACHE[key] = markers
+    return markers
+
+# First-character dispatch, mirroring heuristics_Nov3._marker_dispatch
+_MARKER_DISPATCH_CACHE: dict = {}
+
+def _marker_dispatch(markers: tuple) -> tuple:
+    """Map first character -> marker; multi-char markers stay in a scan tuple."""
+    dispatch = _MARKER_DISPATCH_CACHE.get(markers)
+    if dispatch is None:
+        char_map = {}
+        multi = []
+        for marker in markers:
+            if len(marker) == 1:
+                char_map.setdefault(marker, marker)
+            else:
+                multi.append(marker)
+        dispatch = (char_map, tuple(multi))
+        _MARKER_DISPATCH_CACHE[markers] = dispatch
+    return dispatch
 
 def _is_list_item(text: str, mapping: dict) -> tuple[bool, str, str]:
     """Improved list detection function."""
     stripped = text.lstrip()
-    
+
     if len(stripped) < 3:
         return False, "", text
-    
-    pdf_cfg = mapping.get("pdf", {})
-    markers = pdf_cfg.get("list_markers", [])
-    
-    # Check bullet markers
-    for marker in markers:
-        if marker == "-":
-            if stripped.startswith("- "):
-                remainder = stripped[2:].strip()
-                if remainder and not remainder[0].isdigit():
-                    return True, "itemized", remainder or text.strip()
-        elif stripped.startswith(marker):
+
+    char_map, multi_markers = _marker_dispatch(_list_markers(mapping))
+
+    # Check bullet markers via one first-character hash lookup
+    marker = char_map.get(stripped[0])
+    if marker == "-":
+        if stripped.startswith("- "):
+            remainder = stripped[2:].strip()
+            if remainder and not remainder[0].isdigit():
+                return True, "itemized", remainder or text.strip()
+    elif marker is not None:
+        remainder = stripped[1:].strip()
+        if remainder:
+            return True, "itemized", remainder
+    for marker in multi_markers:
+        if stripped.startswith(marker):
             remainder = stripped[len(marker):].strip()
             if remainder:
                 return True, "itemized", remainder
     
-    # Check ordered list patterns
-    if ORDERED_LIST_RE.match(stripped):
-        match = ORDERED_LIST_RE.match(stripped)
-        if match:
-            marker_text = match.group(0).strip()
-            remainder = ORDERED_LIST_RE.sub("", stripped, count=1).strip()
-            
-            # Detect names like "A. Smith"
-            if len(marker_text) == 2 and marker_text[0].isupper():
-                words = remainder.split()
-                if words and words[0] and words[0][0].isupper() and len(words[0]) > 2:
-                    return False, "", text
-            
-            if remainder:
-                return True, "ordered", remainder
-    
+    # Check ordered list patterns (hand-rolled matcher; remainder sliced
+    # off the match end instead of a second regex pass via .sub)
+    end = _match_ordered(stripped)
+    if end != -1:
+        marker_text = stripped[:end].rstrip()
+        remainder = stripped[end:].strip()
+
+        # Detect names like "A. Smith"
+        if len(marker_text) == 2 and marker_text[0].isupper():
+            words = remainder.split()
+            if words and words[0] and words[0][0].isupper() and len(words[0]) > 2:
+                return False, "", text
+
+        if remainder:
+            return True, "ordered", remainder
+
     return False, "", text
 
 
@@ -72,44 +146,85 @@ def _line_gap(prev_line: Line, next_line: Line) -> float:
     return next_line.top - (prev_line.top + prev_line.height)
 
 
-def _detect_list_sequence(lines: Sequence[Line], start_idx: int, mapping: dict) -> Tuple[bool, str, int]:
-    """Look ahead to confirm list with indentation checking."""
+def _lines_soa(lines: Sequence[Line]) -> tuple:
+    """Parallel (left, top, height, page_num) arrays for a lines sequence.
+
+    Missing coordinates become NaN so downstream comparisons can treat
+    them as "never breaks". Built per call: lists are not weak-referenceable
+    and id()-keyed caching misfires once CPython reuses a freed list's id.
+    """
+    n = len(lines)
+    left = np.fromiter(
+        (l.left if l.left is not None else np.nan for l in lines),
+        dtype=np.float64, count=n)
+    top = np.fromiter(
+        (l.top if l.top is not None else np.nan for l in lines),
+        dtype=np.float64, count=n)
+    height = np.fromiter(
+        (l.height if l.height is not None else np.nan for l in lines),
+        dtype=np.float64, count=n)
+    page_num = np.fromiter((l.page_num for l in lines), dtype=np.int32, count=n)
+    return left, top, height, page_num
+
+
+def _detect_list_sequence(lines: Sequence[Line], start_idx: int, mapping: dict,
+                          classifications: Optional[dict] = None) -> Tuple[bool, str, int]:
+    """Look ahead to confirm list with indentation checking.
+
+    ``classifications`` memoizes _is_list_item by text across the
+    overlapping lookahead windows of one pass (see heuristics_Nov3).
+    """
     if start_idx >= len(lines):
         return False, "", 0
-    
+
+    if classifications is None:
+        classifications = {}
+
     first_line = lines[start_idx]
-    matched, list_type, _ = _is_list_item(first_line.text, mapping)
-    
+    result = classifications.get(first_line.text)
+    if result is None:
+        result = _is_list_item(first_line.text, mapping)
+        classifications[first_line.text] = result
+    matched, list_type, _ = result
+
     if not matched:
         return False, "", 0
-    
+
     # Check indentation
     first_indent = first_line.left if first_line.left is not None else 0
-    consecutive_items = 1
     indent_tolerance = 15
     max_lookahead = 10
-    
-    for i in range(start_idx + 1, min(start_idx + max_lookahead, len(lines))):
-        line = lines[i]
-        
-        if line.page_num != first_line.page_num:
-            break
-        
-        # Check vertical gap
-        prev_line = lines[i - 1]
-        gap = _line_gap(prev_line, line)
-        if prev_line.height and line.height:
-            max_gap = max(prev_line.height, line.height) * 2.5
-            if gap > max_gap:
-                break
-        
-        # Check indentation
-        line_indent = line.left if line.left is not None else 0
-        if abs(line_indent - first_indent) > indent_tolerance:
-            break
-        
-        # Check if also a list item
-        is_item, item_type, _ = _is_list_item(line.text, mapping)
+
+    # Page/gap/indent checks run as array ops over the whole lookahead
+    # window; the first breaking line falls out of one OR + argmax. A NaN
+    # gap (missing top/height) never compares greater, matching the old
+    # _line_gap fallback of 0.0
+    left, top, height, page_num = _lines_soa(lines)
+    end = min(start_idx + max_lookahead, len(lines))
+    cur = slice(start_idx + 1, end)
+    prev = slice(start_idx, end - 1)
+
+    gap = top[cur] - (top[prev] + height[prev])
+    heights_valid = (
+        ~np.isnan(height[prev]) & (height[prev] != 0)
+        & ~np.isnan(height[cur]) & (height[cur] != 0)
+    )
+    max_gap = np.fmax(height[prev], height[cur]) * 2.5
+    break_mask = (
+        (page_num[cur] != page_num[start_idx])
+        | (heights_valid & (gap > max_gap))
+        | (np.abs(np.nan_to_num(left[cur]) - first_indent) > indent_tolerance)
+    )
+    cutoff = int(np.argmax(break_mask)) if break_mask.any() else break_mask.size
+
+    # Only the surviving geometric prefix needs classification
+    consecutive_items = 1
+    for i in range(start_idx + 1, start_idx + 1 + cutoff):
+        result = classifications.get(lines[i].text)
+        if result is None:
+            result = _is_list_item(lines[i].text, mapping)
+            classifications[lines[i].text] = result
+        is_item, item_type, _ = result
         if is_item and item_type == list_type:
             consecutive_items += 1
         else:
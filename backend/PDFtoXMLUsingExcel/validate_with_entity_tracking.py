@@ -12,6 +12,10 @@ Key improvements:
 - Aggregates all errors into a single comprehensive report
 """
 
+import logging
+import mmap
+import multiprocessing
+import os
 import re
 import sys
 import tempfile
@@ -28,14 +32,48 @@ except ImportError:
 
 from validation_report import ValidationReportGenerator, ValidationError
 
+logger = logging.getLogger(__name__)
+
+# Entity extraction is a linear scan over Book.XML; compile the patterns
+# once and match on bytes so the file never needs a full decoded copy
+_DOCTYPE_RE = re.compile(rb'<!DOCTYPE[^>]+\[(.*?)\]>', re.DOTALL)
+_ENTITY_RE = re.compile(rb'<!ENTITY\s+(\w+)\s+SYSTEM\s+"([^"]+)">')
+
+
+# Worker-process state for parallel validation. Compiled DTD objects don't
+# pickle, so each worker compiles the grammar once at pool startup.
+_worker_validator = None
+
+
+def _init_validation_worker(dtd_path_str: str):
+    """Initializer for validation worker processes: one validator per process."""
+    global _worker_validator
+    _worker_validator = EntityTrackingValidator(Path(dtd_path_str))
+
+
+def _validate_one(task: Tuple[str, str]) -> Tuple[str, List[ValidationError]]:
+    """Validate a single chapter file in a worker process."""
+    chapter_path_str, chapter_filename = task
+    errors = _worker_validator.validate_chapter_file(
+        Path(chapter_path_str), chapter_filename
+    )
+    return chapter_filename, errors
+
 
 class EntityTrackingValidator:
     """Validates XML with entity tracking to report actual source files"""
 
-    def __init__(self, dtd_path: Path):
+    def __init__(self, dtd_path: Path, dtd=None):
+        """
+        Args:
+            dtd_path: Path to the DTD file
+            dtd: Optional pre-compiled lxml etree.DTD to reuse; avoids
+                 re-parsing the grammar when several validators/passes
+                 share the same DTD
+        """
         self.dtd_path = dtd_path
-        self.dtd = None
-        if LXML_AVAILABLE:
+        self.dtd = dtd
+        if self.dtd is None and LXML_AVAILABLE:
             self.dtd = etree.DTD(str(dtd_path))
 
     def extract_entity_declarations(self, book_xml_path: Path) -> Dict[str, str]:
@@ -47,21 +85,23 @@ class EntityTrackingValidator:
         """
         entities = {}
 
-        with open(book_xml_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find DOCTYPE declaration
-        doctype_match = re.search(r'<!DOCTYPE[^>]+\[(.*?)\]>', content, re.DOTALL)
-        if not doctype_match:
+        if book_xml_path.stat().st_size == 0:
             return entities
 
-        doctype_content = doctype_match.group(1)
+        # Scan the file through mmap - no full in-memory copy, no decode
+        with open(book_xml_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Find DOCTYPE declaration
+            doctype_match = _DOCTYPE_RE.search(mm)
+            if not doctype_match:
+                return entities
+
+            doctype_content = doctype_match.group(1)
 
         # Extract entity declarations: <!ENTITY ch0001 SYSTEM "ch0001.xml">
-        entity_pattern = r'<!ENTITY\s+(\w+)\s+SYSTEM\s+"([^"]+)">'
-        for match in re.finditer(entity_pattern, doctype_content):
-            entity_name = match.group(1)
-            filename = match.group(2)
+        for match in _ENTITY_RE.finditer(doctype_content):
+            entity_name = match.group(1).decode('utf-8')
+            filename = match.group(2).decode('utf-8')
             entities[entity_name] = filename
 
         return entities
@@ -87,8 +127,15 @@ class EntityTrackingValidator:
         errors = []
 
         try:
-            # Parse the chapter XML
-            parser = etree.XMLParser(dtd_validation=False, resolve_entities=False)
+            # Parse the chapter XML. collect_ids=False skips lxml's ID hash
+            # table and huge_tree lifts the default node limits for big
+            # chapters
+            parser = etree.XMLParser(
+                dtd_validation=False,
+                resolve_entities=False,
+                collect_ids=False,
+                huge_tree=True
+            )
             tree = etree.parse(str(chapter_path), parser)
 
             # Validate against DTD
@@ -138,22 +185,64 @@ class EntityTrackingValidator:
 
         return errors
 
+    def validate_files(
+        self,
+        tasks: List[Tuple[Path, str]]
+    ) -> Dict[str, List[ValidationError]]:
+        """
+        Validate several chapter files, in parallel when there is more than one.
+
+        Workers recompile the DTD once per process via the pool initializer,
+        so each file is validated against an in-memory grammar.
+
+        Args:
+            tasks: List of (chapter_path, display_filename) tuples
+
+        Returns:
+            Dictionary mapping display filename to its list of ValidationErrors
+        """
+        results: Dict[str, List[ValidationError]] = {}
+
+        if len(tasks) > 1 and LXML_AVAILABLE:
+            processes = min(32, os.cpu_count() or 1, len(tasks))
+            with multiprocessing.Pool(
+                processes=processes,
+                initializer=_init_validation_worker,
+                initargs=(str(self.dtd_path),)
+            ) as pool:
+                worker_tasks = [(str(path), filename) for path, filename in tasks]
+                for filename, errors in pool.imap_unordered(
+                    _validate_one, worker_tasks, chunksize=8
+                ):
+                    results[filename] = errors
+        else:
+            for chapter_path, filename in tasks:
+                results[filename] = self.validate_chapter_file(chapter_path, filename)
+
+        return results
+
     def validate_zip_package(
         self,
         zip_path: Path,
-        output_report_path: Optional[Path] = None
-    ) -> ValidationReportGenerator:
+        output_report_path: Optional[Path] = None,
+        count_only: bool = False
+    ):
         """
         Validate all XML files in a ZIP package.
 
         Args:
             zip_path: Path to ZIP package
             output_report_path: Optional path for Excel report output
+            count_only: When True, skip report assembly entirely and return
+                        just the total error count - for intermediate passes
+                        where only the number matters
 
         Returns:
-            ValidationReportGenerator with all errors
+            ValidationReportGenerator with all errors, or an int when
+            count_only is True
         """
         report = ValidationReportGenerator()
+        error_count = 0
 
         with tempfile.TemporaryDirectory() as tmpdir:
             extract_dir = Path(tmpdir)
@@ -170,7 +259,8 @@ class EntityTrackingValidator:
                     except zipfile.BadZipFile as e:
                         # Log corrupted file but continue processing
                         corrupted_files.append(zip_info.filename)
-                        print(f"  Warning: Skipping corrupted file: {zip_info.filename} ({e})")
+                        logger.warning("Skipping corrupted file: %s (%s)",
+                                       zip_info.filename, e)
 
                         # Add to validation report
                         report.add_error(ValidationError(
@@ -184,7 +274,8 @@ class EntityTrackingValidator:
                     except Exception as e:
                         # Handle other extraction errors
                         corrupted_files.append(zip_info.filename)
-                        print(f"  Warning: Failed to extract: {zip_info.filename} ({e})")
+                        logger.warning("Failed to extract: %s (%s)",
+                                       zip_info.filename, e)
 
                         report.add_error(ValidationError(
                             xml_file=zip_info.filename,
@@ -199,21 +290,30 @@ class EntityTrackingValidator:
                 print(f"  Note: Skipped {len(corrupted_files)} corrupted/unextractable file(s)")
                 print(f"  Continuing validation with successfully extracted files...")
 
-            # Find Book.XML
-            book_xml_files = list(extract_dir.rglob("Book.XML"))
-            if not book_xml_files:
+            # Find Book.XML (scandir walk with early exit instead of an
+            # rglob pass that stats every extracted file)
+            book_xml_path = None
+            pending = [extract_dir]
+            while pending and book_xml_path is None:
+                for entry in os.scandir(pending.pop()):
+                    if entry.is_dir():
+                        pending.append(Path(entry.path))
+                    elif entry.name == "Book.XML":
+                        book_xml_path = Path(entry.path)
+                        break
+
+            if book_xml_path is None:
                 print("Error: Book.XML not found in package")
-                return report
-
-            book_xml_path = book_xml_files[0]
+                return report.get_error_count() if count_only else report
             base_dir = book_xml_path.parent
 
             # Extract entity declarations
             entities = self.extract_entity_declarations(book_xml_path)
             print(f"Found {len(entities)} chapter entity references")
 
-            # Validate each chapter file
+            # Validate each chapter file (in parallel across processes)
             print("Validating chapter files...")
+            tasks = []
             for entity_name, filename in sorted(entities.items()):
                 chapter_path = base_dir / filename
 
@@ -228,17 +328,30 @@ class EntityTrackingValidator:
                     ))
                     continue
 
-                # Validate this chapter
-                chapter_errors = self.validate_chapter_file(chapter_path, filename)
+                tasks.append((chapter_path, filename))
 
-                # Add errors to report
-                for error in chapter_errors:
-                    report.add_error(error)
+            errors_by_file = self.validate_files(tasks)
 
+            # Report in entity order regardless of worker completion order
+            for chapter_path, filename in tasks:
+                chapter_errors = errors_by_file.get(filename, [])
+
+                if count_only:
+                    error_count += len(chapter_errors)
+                else:
+                    for error in chapter_errors:
+                        report.add_error(error)
+
+                # Per-file lines are DEBUG: with thousands of chapters the
+                # eager f-string + stdout write dominates otherwise
                 if chapter_errors:
-                    print(f"  {filename}: {len(chapter_errors)} error(s)")
+                    logger.debug("%s: %d error(s)", filename, len(chapter_errors))
                 else:
-                    print(f"  {filename}: ✓ Valid")
+                    logger.debug("%s: ✓ Valid", filename)
+
+        if count_only:
+            # Include any extraction/missing-file errors recorded above
+            return error_count + report.get_error_count()
 
         # Generate Excel report if requested
         if output_report_path and report.has_errors():
@@ -284,6 +397,8 @@ class EntityTrackingValidator:
 def main():
     import argparse
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(
         description="Validate RittDoc XML package with entity tracking"
     )